@@ -4,7 +4,7 @@ from setuptools import setup, find_packages
 
 current_path = os.path.abspath(os.path.dirname(__file__))
 
-requirements = ("numpy", "matplotlib", "scikit-image", "progressbar2")
+requirements = ("numpy", "scipy", "matplotlib", "scikit-image", "progressbar2")
 
 dev_requirements = ("pytest", "pytest-runner")
 
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+import tracklib.core.Coords as Coords
+from tracklib.core.Coords import ECEFCoords, ENUCoords, GeoCoords
+from tracklib.core.Coords import geo2ecef, ecef2geo, ecef2enu, enu2ecef
+from tracklib.core.Coords import geo2lamb93, lamb932geo
+
+
+class TestCoords(unittest.TestCase):
+
+    __epsilon = 1e-6
+
+    def setUp(self):
+        self.lon = [2.4242, 5.7245, -73.9857, 151.2093]
+        self.lat = [48.8448, 45.1885, 40.7484, -33.8688]
+        self.hgt = [52.0, 212.0, 381.0, 58.0]
+        self.base = GeoCoords(2.3522, 48.8566, 35.0)
+
+    def test_geo_ecef_batch(self):
+        X, Y, Z = geo2ecef(self.lon, self.lat, self.hgt)
+        for i in range(len(self.lon)):
+            xyz = GeoCoords(self.lon[i], self.lat[i], self.hgt[i]).toECEFCoords()
+            self.assertAlmostEqual(xyz.X, X[i], delta=self.__epsilon)
+            self.assertAlmostEqual(xyz.Y, Y[i], delta=self.__epsilon)
+            self.assertAlmostEqual(xyz.Z, Z[i], delta=self.__epsilon)
+
+        lon, lat, hgt = ecef2geo(X, Y, Z)
+        for i in range(len(self.lon)):
+            geo = ECEFCoords(X[i], Y[i], Z[i]).toGeoCoords()
+            self.assertAlmostEqual(geo.lon, lon[i], delta=self.__epsilon)
+            self.assertAlmostEqual(geo.lat, lat[i], delta=self.__epsilon)
+            self.assertAlmostEqual(geo.hgt, hgt[i], delta=self.__epsilon)
+            self.assertAlmostEqual(self.lon[i], lon[i], delta=self.__epsilon)
+            self.assertAlmostEqual(self.lat[i], lat[i], delta=self.__epsilon)
+            self.assertAlmostEqual(self.hgt[i], hgt[i], delta=1e-3)
+
+    def test_ecef2geo_formulas(self):
+        X, Y, Z = geo2ecef(self.lon, self.lat, self.hgt)
+        for i in range(len(self.lon)):
+            olson = Coords._ecef2geo_olson(X[i], Y[i], Z[i])
+            bowring = Coords._ecef2geo_bowring(X[i], Y[i], Z[i])
+            self.assertAlmostEqual(olson[1], self.lat[i], delta=1e-12)
+            self.assertAlmostEqual(olson[2], self.hgt[i], delta=1e-6)
+            for k in range(3):
+                self.assertAlmostEqual(olson[k], bowring[k], delta=1e-5)
+
+    def test_ecef2geo_polar(self):
+        # Poles, polar axis and center of the Earth: batch and scalar agree
+        X = [0.0, 1e-3, 0.0, 0.0, 1.0, 4e6]
+        Y = [0.0, 0.0, 0.0, 0.0, 2.0, 0.0]
+        Z = [6356752.3, 6356752.3, -6356752.3, 0.0, 3.0, 1e6]
+        lon, lat, hgt = ecef2geo(X, Y, Z)
+        self.assertAlmostEqual(90.0, lat[0], delta=1e-12)
+        self.assertAlmostEqual(-90.0, lat[2], delta=1e-12)
+        for i in range(len(X)):
+            geo = ECEFCoords(X[i], Y[i], Z[i]).toGeoCoords()
+            self.assertAlmostEqual(geo.lon, lon[i], delta=self.__epsilon)
+            self.assertAlmostEqual(geo.lat, lat[i], delta=self.__epsilon)
+            self.assertAlmostEqual(geo.hgt, hgt[i], delta=self.__epsilon)
+
+    def test_ecef_enu_batch(self):
+        X, Y, Z = geo2ecef(self.lon, self.lat, self.hgt)
+        E, N, U = ecef2enu(X, Y, Z, self.base)
+        for i in range(len(self.lon)):
+            enu = ECEFCoords(X[i], Y[i], Z[i]).toENUCoords(self.base)
+            self.assertAlmostEqual(enu.E, E[i], delta=self.__epsilon)
+            self.assertAlmostEqual(enu.N, N[i], delta=self.__epsilon)
+            self.assertAlmostEqual(enu.U, U[i], delta=self.__epsilon)
+
+        X2, Y2, Z2 = enu2ecef(E, N, U, self.base)
+        self.assertTrue(np.allclose(X, X2, rtol=0, atol=1e-6))
+        self.assertTrue(np.allclose(Y, Y2, rtol=0, atol=1e-6))
+        self.assertTrue(np.allclose(Z, Z2, rtol=0, atol=1e-6))
+
+    def test_enu_base_update(self):
+        point = GeoCoords(2.3622, 48.8666, 35.0)
+        base = self.base.copy()
+        enu1 = point.toENUCoords(base)
+        self.assertAlmostEqual(enu1.norm2D(), point.distance2DTo(base), delta=1e-9)
+
+        base.lat += 0.01
+        enu2 = point.toENUCoords(base)
+        self.assertAlmostEqual(0.0, enu2.N, delta=1.0)
+        ref = point.toECEFCoords().toENUCoords(base.toECEFCoords())
+        self.assertAlmostEqual(ref.E, enu2.E, delta=self.__epsilon)
+        self.assertAlmostEqual(ref.N, enu2.N, delta=self.__epsilon)
+        self.assertAlmostEqual(ref.U, enu2.U, delta=self.__epsilon)
+
+    def test_enu_operators(self):
+        p1 = ENUCoords(10.0, 20.0, 5.0)
+        p2 = ENUCoords(13.0, 24.0, 17.0)
+
+        d = p2 - p1
+        self.assertEqual((3.0, 4.0, 12.0), (d.E, d.N, d.U))
+        s = d + p1
+        self.assertEqual((p2.E, p2.N, p2.U), (s.E, s.N, s.U))
+
+        self.assertAlmostEqual(5.0, p1.distance2DTo(p2), delta=self.__epsilon)
+        self.assertAlmostEqual(13.0, p1.distanceTo(p2), delta=self.__epsilon)
+        self.assertAlmostEqual(math.atan2(3, 4), p1.azimuthTo(p2), delta=1e-12)
+        self.assertAlmostEqual(math.atan2(12, 5), p1.elevationTo(p2), delta=1e-12)
+
+        # Same direction whatever the coordinates system
+        g1 = p1.toGeoCoords(self.base)
+        g2 = p2.toGeoCoords(self.base)
+        self.assertAlmostEqual(p1.azimuthTo(p2), g1.azimuthTo(g2), delta=1e-5)
+        x1 = g1.toECEFCoords()
+        x2 = g2.toECEFCoords()
+        self.assertAlmostEqual(p1.azimuthTo(p2), x1.azimuthTo(x2), delta=1e-5)
+        d = x2 - x1
+        self.assertAlmostEqual(13.0, d.norm(), delta=self.__epsilon)
+
+        q1, q2 = p1.copy(), p2.copy()
+        Coords.rotateAll([q1, q2], 0.3)
+        p1.rotate(0.3)
+        p2.rotate(0.3)
+        self.assertEqual((p1.E, p1.N, p2.E, p2.N), (q1.E, q1.N, q2.E, q2.N))
+        self.assertAlmostEqual(13.0, x1.distanceTo(x2), delta=self.__epsilon)
+
+    def test_projections(self):
+        proj = self.base.toProjCoords(2154)
+        self.assertAlmostEqual(proj.E, 652469.023, delta=1e-3)
+        self.assertAlmostEqual(proj.N, 6862035.260, delta=1e-3)
+        self.assertAlmostEqual(proj.U, 35.0, delta=self.__epsilon)
+
+        geo = proj.toGeoCoords(2154)
+        self.assertAlmostEqual(geo.lon, self.base.lon, delta=1e-9)
+        self.assertAlmostEqual(geo.lat, self.base.lat, delta=1e-9)
+
+        geo = ENUCoords(448251.0, 5411932.0).toGeoCoords(32631)
+        self.assertAlmostEqual(geo.lon, 2.294489245, delta=1e-9)
+        self.assertAlmostEqual(geo.lat, 48.858193837, delta=1e-9)
+
+        # Edges of zones, in both hemispheres
+        geo = ENUCoords(736446.0261, 4987329.5047).toGeoCoords(32631)
+        self.assertAlmostEqual(geo.lon, 6.0, delta=1e-8)
+        self.assertAlmostEqual(geo.lat, 45.0, delta=1e-8)
+        geo = ENUCoords(640130.3133, 6347713.8851).toGeoCoords(32719)
+        self.assertAlmostEqual(geo.lon, -67.5, delta=1e-8)
+        self.assertAlmostEqual(geo.lat, -33.0, delta=1e-8)
+
+    def test_array_coords(self):
+        geo = GeoCoords(np.array(self.lon), np.array(self.lat), np.array(self.hgt))
+        xyz = geo.toECEFCoords()
+        self.assertIsInstance(xyz.X, np.ndarray)
+        enu = xyz.toENUCoords(self.base)
+        self.assertIsInstance(enu, ENUCoords)
+        back = enu.toGeoCoords(self.base)
+        self.assertTrue(np.allclose(back.lon, self.lon, rtol=0, atol=1e-9))
+        self.assertTrue(np.allclose(back.lat, self.lat, rtol=0, atol=1e-9))
+
+    def test_array_projections(self):
+        lon = np.array([-1.5, 2.3522, 5.7245, 7.75])
+        lat = np.array([43.4, 48.8566, 45.1885, 48.58])
+        geo = GeoCoords(lon, lat, np.zeros(4))
+        proj = geo.toProjCoords(2154)
+        back = proj.toGeoCoords(2154)
+        for i in range(len(lon)):
+            ref = GeoCoords(lon[i], lat[i]).toProjCoords(2154)
+            self.assertAlmostEqual(ref.E, proj.E[i], delta=1e-6)
+            self.assertAlmostEqual(ref.N, proj.N[i], delta=1e-6)
+            self.assertAlmostEqual(lon[i], back.lon[i], delta=1e-9)
+            self.assertAlmostEqual(lat[i], back.lat[i], delta=1e-9)
+
+        X, Y = geo2lamb93(lon.tolist(), lat.tolist())
+        self.assertTrue(np.array_equal(proj.E, X))
+        lon2, lat2 = lamb932geo(X, Y)
+        self.assertTrue(np.array_equal(back.lat, lat2))
+
+        E = np.array([448251.0, 500000.0, 300000.0])
+        N = np.array([5411932.0, 4000000.0, 6500000.0])
+        geo = ENUCoords(E, N, np.zeros(3)).toGeoCoords(32631)
+        for i in range(len(E)):
+            ref = ENUCoords(E[i], N[i]).toGeoCoords(32631)
+            self.assertAlmostEqual(ref.lon, geo.lon[i], delta=1e-9)
+            self.assertAlmostEqual(ref.lat, geo.lat[i], delta=1e-9)
+
+    def test_unknown_srid(self):
+        with self.assertRaises(KeyError):
+            self.base.toProjCoords(4326)
+        with self.assertRaises(KeyError):
+            ENUCoords(448251.0, 5411932.0).toGeoCoords(32661)
+
+
+if __name__ == '__main__':
+    #unittest.main()
+    suite = unittest.TestSuite()
+    suite.addTest(TestCoords("test_geo_ecef_batch"))
+    suite.addTest(TestCoords("test_ecef2geo_formulas"))
+    suite.addTest(TestCoords("test_ecef2geo_polar"))
+    suite.addTest(TestCoords("test_ecef_enu_batch"))
+    suite.addTest(TestCoords("test_enu_base_update"))
+    suite.addTest(TestCoords("test_enu_operators"))
+    suite.addTest(TestCoords("test_projections"))
+    suite.addTest(TestCoords("test_array_coords"))
+    suite.addTest(TestCoords("test_array_projections"))
+    suite.addTest(TestCoords("test_unknown_srid"))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
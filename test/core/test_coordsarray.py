@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+"""
+
+import math
+import unittest
+
+import numpy as np
+
+from tracklib.core.Coords import ENUCoords, GeoCoords
+from tracklib.core.CoordsArray import ECEFArray, ENUArray, GeoArray
+
+
+class TestCoordsArray(unittest.TestCase):
+
+    __epsilon = 1e-6
+
+    def setUp(self):
+        self.points = [
+            GeoCoords(2.4242, 48.8448, 52.0),
+            GeoCoords(2.4250, 48.8452, 54.5),
+            GeoCoords(2.4263, 48.8461, 51.0),
+        ]
+        self.base = GeoCoords(2.4242, 48.8448, 50.0)
+
+    def test_conversions(self):
+        geo = GeoArray.fromList(self.points)
+        self.assertEqual(3, len(geo))
+
+        xyz = geo.toECEFCoords()
+        self.assertIsInstance(xyz, ECEFArray)
+        enu = geo.toENUCoords(self.base)
+        self.assertIsInstance(enu, ENUArray)
+
+        for i in range(len(self.points)):
+            ref = self.points[i].toENUCoords(self.base)
+            self.assertAlmostEqual(ref.E, enu[i].E, delta=self.__epsilon)
+            self.assertAlmostEqual(ref.N, enu[i].N, delta=self.__epsilon)
+            self.assertAlmostEqual(ref.U, enu[i].U, delta=self.__epsilon)
+
+        back = enu.toGeoCoords(self.base).toList()
+        for i in range(len(self.points)):
+            self.assertAlmostEqual(self.points[i].lon, back[i].lon, delta=1e-9)
+            self.assertAlmostEqual(self.points[i].lat, back[i].lat, delta=1e-9)
+            self.assertAlmostEqual(self.points[i].hgt, back[i].hgt, delta=1e-6)
+
+    def test_metrics(self):
+        enu = ENUArray([0.0, 3.0, 1.0], [0.0, 4.0, 1.0], [0.0, 12.0, 0.0])
+        self.assertTrue(np.allclose([0.0, 5.0, 2 ** 0.5], enu.norm2D()))
+        self.assertTrue(np.allclose([0.0, 13.0, 2 ** 0.5], enu.norm()))
+
+        origin = ENUCoords(1.0, 1.0, 0.0)
+        d = enu.distance2DTo(origin)
+        self.assertTrue(np.allclose([2 ** 0.5, 13 ** 0.5, 0.0], d))
+
+        diff = enu - origin
+        self.assertTrue(np.allclose([-1.0, 2.0, 0.0], diff.E))
+        self.assertTrue(np.allclose([-1.0, 3.0, 0.0], diff.N))
+
+        pts = enu.toList()
+        self.assertEqual(3, len(pts))
+        self.assertTrue(np.array_equal(enu.E, ENUArray.fromList(pts).E))
+
+        enu.rotate(math.pi / 3)
+        for p in pts:
+            p.rotate(math.pi / 3)
+        self.assertTrue(np.allclose([p.E for p in pts], enu.E))
+        self.assertTrue(np.allclose([p.N for p in pts], enu.N))
+
+
+if __name__ == '__main__':
+    #unittest.main()
+    suite = unittest.TestSuite()
+    suite.addTest(TestCoordsArray("test_conversions"))
+    suite.addTest(TestCoordsArray("test_metrics"))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
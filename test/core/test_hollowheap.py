@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+"""
+
+import random
+import unittest
+
+from tracklib.core.HollowHeap import HollowHeap
+
+
+class TestHollowHeap(unittest.TestCase):
+    def test_priorities(self):
+        heap = HollowHeap({"a": 5, "b": 3, "c": 4})
+        self.assertEqual(3, len(heap))
+        self.assertEqual("b", heap.smallest())
+
+        heap["a"] = 1  # decrease-key
+        heap["b"] = 6  # increase-key
+        del heap["c"]
+        heap["d"] = 2
+        self.assertTrue("a" in heap)
+        self.assertFalse("c" in heap)
+        self.assertEqual(6, heap["b"])
+        node = heap._nodes["b"]
+        heap["b"] = 6.0  # same key: node is kept, with the new value
+        self.assertIs(node, heap._nodes["b"])
+        self.assertIsInstance(heap["b"], float)
+        self.assertEqual(["a", "d", "b"], list(heap.sorted_iter()))
+        self.assertEqual(0, len(heap))
+        with self.assertRaises(IndexError):
+            heap.pop_smallest()
+
+    def test_random_operations(self):
+        rand = random.Random(0)
+        heap = HollowHeap()
+        ref = {}
+        for i in range(5000):
+            op = rand.random()
+            if op < 0.5:
+                item = rand.randrange(100)
+                heap[item] = ref[item] = rand.randrange(1000)
+            elif op < 0.6 and ref:
+                item = rand.choice(list(ref))
+                del heap[item]
+                del ref[item]
+            elif ref:
+                item = heap.pop_smallest()
+                self.assertEqual(min(ref.values()), ref.pop(item))
+            self.assertEqual(len(ref), len(heap))
+        keys = [ref[item] for item in heap.sorted_iter()]
+        self.assertEqual(sorted(ref.values()), keys)
+
+
+if __name__ == '__main__':
+    #unittest.main()
+    suite = unittest.TestSuite()
+    suite.addTest(TestHollowHeap("test_priorities"))
+    suite.addTest(TestHollowHeap("test_random_operations"))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+"""
+
+import unittest
+
+import numpy as np
+
+import tracklib.core.Utils as Utils
+from tracklib.core.Coords import ECEFCoords, ENUCoords, GeoCoords
+from tracklib.core.Kernel import ExponentialKernel, GaussianKernel
+
+
+class TestUtils(unittest.TestCase):
+
+    __epsilon = 1e-9
+
+    def test_nan_float(self):
+        self.assertTrue(Utils.isnan(Utils.NAN))
+        self.assertFalse(Utils.isnan(1.5))
+        self.assertFalse(Utils.isnan("a"))
+        self.assertTrue(Utils.isfloat("3.25"))
+        self.assertTrue(Utils.isfloat(" -1e-3 "))
+        self.assertTrue(Utils.isfloat(2))
+        self.assertFalse(Utils.isfloat("speed"))
+        self.assertFalse(Utils.isfloat(None))
+
+    def test_listify(self):
+        L = ["x", "y"]
+        self.assertIs(L, Utils.listify(L))
+        self.assertEqual(["x", "y"], Utils.listify(("x", "y")))
+        self.assertEqual(["speed"], Utils.listify("speed"))
+        self.assertEqual([2.5], Utils.listify(2.5))
+        self.assertEqual("speed", Utils.unlistify(["speed"]))
+        self.assertEqual(3, Utils.unlistify((3,)))
+        self.assertEqual([1, 2], Utils.unlistify([1, 2]))
+        self.assertEqual("speed", Utils.unlistify("speed"))
+        self.assertEqual(2.5, Utils.unlistify(2.5))
+
+    def test_make_coords(self):
+        self.assertIsInstance(Utils.makeCoords(1.0, 2.0, 3.0, "ENU"), ENUCoords)
+        self.assertIsInstance(Utils.makeCoords(1.0, 2.0, 3.0, "Geo"), GeoCoords)
+        self.assertIsInstance(Utils.makeCoords(1.0, 2.0, 3.0, "ECEFCoords"), ECEFCoords)
+        c = Utils.makeCoords(1.0, 2.0, 3.0, "geocoords")
+        self.assertEqual((1.0, 2.0, 3.0), (c.lon, c.lat, c.hgt))
+        with self.assertRaises(ValueError):
+            Utils.makeCoords(1.0, 2.0, 3.0, "L93")
+
+    def test_distance_matrix(self):
+        # Scalar values (e.g. timestamps)
+        T1 = [1.6e9, 1.6e9 + 1.5, 1.6e9 + 4.0]
+        T2 = [1.6e9 + 1.0, 1.6e9 + 2.0]
+        D = Utils.makeDistanceMatrix(T1, T2)
+        self.assertEqual((3, 2), D.shape)
+        self.assertTrue(np.allclose([[1, 2], [0.5, 0.5], [3, 2]], D, atol=self.__epsilon))
+
+        # Points
+        D = Utils.makeDistanceMatrix([(0.0, 0.0), (3.0, 4.0)], [(0.0, 4.0)])
+        self.assertTrue(np.allclose([[4.0], [3.0]], D, atol=self.__epsilon))
+
+        # Self distances
+        S = [(0.0, 0.0), (3.0, 4.0), (6.0, 8.0)]
+        D = Utils.makeDistanceMatrix(S, S)
+        self.assertTrue(np.allclose([[0, 5, 10], [5, 0, 5], [10, 5, 0]], D))
+        D = Utils.makeDistanceMatrix(T1, T1)
+        self.assertTrue(np.allclose([[0, 1.5, 4], [1.5, 0, 2.5], [4, 2.5, 0]], D))
+
+        # Single precision output
+        D = Utils.makeDistanceMatrix(T1, T2, dtype=np.float32)
+        self.assertEqual(np.float32, D.dtype)
+        self.assertTrue(np.allclose([[1, 2], [0.5, 0.5], [3, 2]], D, atol=1e-6))
+        D = Utils.makeDistanceMatrix([(0.0, 0.0)], [(3.0, 4.0)], dtype=np.float32)
+        self.assertEqual(np.float32, D.dtype)
+
+        # Integer output, on both scalar values and points
+        D = Utils.makeDistanceMatrix([0.0, 2.0], [3.0], dtype=np.int64)
+        self.assertEqual(np.int64, D.dtype)
+        self.assertEqual([[3], [1]], D.tolist())
+        D = Utils.makeDistanceMatrix([(0.0, 0.0)], [(3.0, 4.0)], dtype=np.int64)
+        self.assertEqual(np.int64, D.dtype)
+        self.assertEqual([[5]], D.tolist())
+
+        # Squared distances
+        D = Utils.makeDistanceMatrix(S, S[:2], squared=True)
+        self.assertTrue(np.allclose([[0, 25], [25, 0], [100, 25]], D))
+        D = Utils.makeDistanceMatrix(T1, T2, squared=True)
+        self.assertTrue(np.allclose([[1, 4], [0.25, 0.25], [9, 4]], D, atol=1e-6))
+
+    def test_distance_matrix_tiled(self):
+        rand = np.random.default_rng(0)
+        P1 = rand.random((50, 2))
+        P2 = rand.random((37, 2))
+        D = Utils.makeDistanceMatrixTiled(P1, P2, block=16)
+        self.assertTrue(np.allclose(Utils.makeDistanceMatrix(P1, P2), D))
+        T = list(rand.random(20))
+        out = np.zeros((20, 20), dtype=np.float32)
+        D = Utils.makeDistanceMatrixTiled(T, T, block=7, out=out, squared=True)
+        self.assertIs(out, D)
+        ref = Utils.makeDistanceMatrix(T, T, squared=True)
+        self.assertTrue(np.allclose(ref, D, atol=1e-6))
+        with self.assertRaises(ValueError):
+            Utils.makeDistanceMatrixTiled(T, T, out=np.zeros((20, 19)))
+
+    def test_covariance_matrix(self):
+        T1 = [0.0, 0.5, 2.0, 7.0]
+        T2 = [1.0, 3.0]
+        for kernel in [GaussianKernel(2.0), ExponentialKernel(1.5)]:
+            f = kernel.getFunction()
+            K = Utils.makeCovarianceMatrixFromKernel(kernel, T1, T2, 2.0)
+            self.assertEqual((4, 2), K.shape)
+            for i in range(len(T1)):
+                for j in range(len(T2)):
+                    ref = 4.0 * f(abs(T1[i] - T2[j]))
+                    self.assertAlmostEqual(ref, K[i, j], delta=self.__epsilon)
+
+        # Kernel of squared distances, on 2D points
+        kernel = GaussianKernel(2.0)
+        P = [(0.0, 0.0), (1.0, 2.0), (4.0, -1.0)]
+        K = Utils.makeCovarianceMatrixFromKernel(kernel, P, P)
+        ref = kernel.getVectorizedFunction()(Utils.makeDistanceMatrix(P, P))
+        self.assertTrue(np.allclose(ref, K, atol=self.__epsilon))
+
+    def test_comp_like(self):
+        self.assertTrue(Utils.compLike("2018-01-12 10:00:00", "2018-01-%"))
+        self.assertTrue(Utils.compLike("2018-01-12 10:00:00", "%01-12%"))
+        self.assertTrue(Utils.compLike("2018-01-12 10:00:00", "2018%12%00"))
+        self.assertFalse(Utils.compLike("2018-01-12 10:00:00", "2018%02%"))
+        self.assertFalse(Utils.compLike("2018-01-12", "%12%01%"))
+        self.assertTrue(Utils.compLike("abc", "%"))
+        self.assertTrue(Utils.compLike("abc", "abc"))
+        self.assertFalse(Utils.compLike("b", "abc"))
+
+    def test_priority_dict(self):
+        d = Utils.priority_dict({"a": 5, "b": 3, "c": 4})
+        self.assertEqual("b", d.smallest())
+        d["a"] = 1
+        d["b"] = 6
+        del d["c"]
+        d["d"] = 2
+        for i in range(100):
+            d["e"] = 200 - i
+        self.assertEqual("a", d.smallest())
+        self.assertEqual(["a", "d", "b", "e"], list(d.sorted_iter()))
+        self.assertEqual(0, len(d))
+
+        # Stale entries count
+        d = Utils.priority_dict({"a": 5, "b": 3})
+        d["a"] = 5  # Same priority: no new heap entry
+        self.assertEqual(0, d._stale)
+        self.assertEqual(2, len(d._heap))
+        d["b"] = 3.0  # Equal priority: value is still stored
+        self.assertIsInstance(d["b"], float)
+        self.assertEqual(0, d._stale)
+        d["a"] = 1
+        del d["b"]
+        self.assertEqual(2, d._stale)
+        self.assertEqual("a", d.pop_smallest())
+        self.assertEqual(2, d._stale)
+        self.assertEqual(2, len(d._heap))
+
+    def test_colors(self):
+        color = [0.0, 0.5, 1.0]
+        self.assertEqual("0xffff7f00", Utils.rgbToHex(color))
+        self.assertEqual(3, len(color))
+        self.assertEqual("0x7f0000ff", Utils.rgbToHex([1.0, 0.0, 0.0, 0.5]))
+        H = Utils.rgbToHexArray([[0.0, 0.5, 1.0, 1.0], [1.0, 0.0, 0.0, 0.5]])
+        self.assertEqual(["0xffff7f00", "0x7f0000ff"], H.tolist())
+        H = Utils.rgbToHexArray(np.array([[0.0, 0.5, 1.0], [1.0, 0.0, 0.0]]))
+        self.assertEqual(["0xffff7f00", "0xff0000ff"], H.tolist())
+
+        # Out of range components are clipped
+        color = [1.2, -0.1, 0.5, 2.0]
+        self.assertEqual("0xff7f00ff", Utils.rgbToHex(color))
+        self.assertEqual([Utils.rgbToHex(color)], Utils.rgbToHexArray([color]).tolist())
+
+        cmin = [0.0, 0.0, 1.0, 1.0]
+        cmax = [1.0, 0.0, 0.0, 0.5]
+        c = Utils.interpColors(2.5, 0.0, 10.0, cmin, cmax)
+        self.assertEqual(4, len(c))
+        self.assertTrue(np.allclose([0.25, 0.0, 0.75, 0.875], c))
+        self.assertEqual(3, len(Utils.interpColors(2.5, 0.0, 10.0, cmin[:3], cmax[:3])))
+        C = Utils.interpColors(np.array([0.0, 2.5, 10.0]), 0.0, 10.0, cmin, cmax)
+        self.assertEqual((3, 4), C.shape)
+        self.assertTrue(np.allclose(c, C[1]))
+        self.assertTrue(np.allclose(cmax, C[2]))
+        V = np.array([[0.0, 2.5], [5.0, 10.0]])
+        C = Utils.interpColors(V, 0.0, 10.0, cmin, cmax)
+        self.assertEqual((2, 2, 4), C.shape)
+        self.assertTrue(np.allclose(c, C[0, 1]))
+        C = Utils.interpColors(np.array([0.0, 2.5]), 0.0, 10.0, cmin[:3], cmax[:3])
+        self.assertEqual((2, 3), C.shape)
+
+        cmap = Utils.getColorMap([255, 0, 0], [0, 0, 255])
+        self.assertIs(cmap, Utils.getColorMap((255, 0, 0), (0, 0, 255)))
+        self.assertTrue(np.allclose([0.5, 0.0, 0.5, 1.0], cmap(0.5), atol=1e-2))
+        cmap = Utils.getOffsetColorMap([255, 0, 0], [0, 0, 255], 0.5)
+        self.assertTrue(np.allclose([1.0, 0.0, 0.0, 1.0], cmap(0.25), atol=1e-2))
+        self.assertTrue(np.allclose([0.5, 0.0, 0.5, 1.0], cmap(0.75), atol=1e-2))
+
+
+if __name__ == '__main__':
+    #unittest.main()
+    suite = unittest.TestSuite()
+    suite.addTest(TestUtils("test_nan_float"))
+    suite.addTest(TestUtils("test_listify"))
+    suite.addTest(TestUtils("test_make_coords"))
+    suite.addTest(TestUtils("test_distance_matrix"))
+    suite.addTest(TestUtils("test_distance_matrix_tiled"))
+    suite.addTest(TestUtils("test_covariance_matrix"))
+    suite.addTest(TestUtils("test_comp_like"))
+    suite.addTest(TestUtils("test_colors"))
+    suite.addTest(TestUtils("test_priority_dict"))
+    runner = unittest.TextTestRunner()
+    runner.run(suite)
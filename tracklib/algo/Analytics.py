@@ -40,7 +40,7 @@ def abs_curv(track, i):
 def heading(track, i):
     if i == len(track):
         return heading(track, i - 1)
-    return track.getObs(i).position.azimuthTo(track.getObs(i - 1).position)
+    return track.getObs(i - 1).position.azimuthTo(track.getObs(i).position)
 
 
 def speed(track, i):
@@ -5,6 +5,10 @@ This Module contains the classes to manage point coordinates:
     - :class:`ENUCoords` : For local projection (East, North, Up)
     - :class:`ECEFCoords` : For Earth-Centered-Earth-Fixed coordinates (X, Y, Z)
 
+Conversions of many points at once are available on NumPy arrays with
+:func:`geo2ecef`, :func:`ecef2geo`, :func:`ecef2enu` and :func:`enu2ecef`
+(and :func:`geo2lamb93`, :func:`lamb932geo` for Lambert 93).
+
 The current constants are used in this module : 
 
 .. py:data:: Re
@@ -18,6 +22,13 @@ Earth equatorial radius
     :value: 1.0 / 298.257223563
 
 Earth eccentricity
+
+.. py:data:: ECEF2GEO_OLSON
+    :type: bool
+    :value: True
+
+Use Olson's closed-form formula for ECEF to geodetic conversion (otherwise,
+Bowring's formula with a single iteration is used)
 """
 
 # For type annotation
@@ -25,17 +36,35 @@ from __future__ import annotations
 from typing import Union
 
 import math
-import copy
-import matplotlib.pyplot as plt
+import cmath
+import numpy as np
 
 
 Re = 6378137.0  # Earth equatorial radius
 Fe = 1.0 / 298.257223563  # Earth eccentricity
 
+ECEF2GEO_OLSON = True  # Olson (True) or Bowring (False) ECEF -> geodetic
+
+# Derived ellipsoid constants
+_E2 = Fe * (2 - Fe)  # squared first eccentricity
+_B = Re * (1 - Fe)  # polar radius
+_H = Re * Re - _B * _B
+
+# Constants of Olson's ECEF -> geodetic formula
+_OLSON_A1 = Re * _E2
+_OLSON_A2 = _OLSON_A1 * _OLSON_A1
+_OLSON_A3 = _OLSON_A1 * _E2 / 2
+_OLSON_A4 = 2.5 * _OLSON_A2
+_OLSON_A5 = _OLSON_A1 + _OLSON_A3
+_OLSON_A6 = 1 - _E2
+_OLSON_RMIN = 1e5  # Olson's formula diverges near the center of the Earth
+
 
 class GeoCoords:
     """Class to represent geographics coordinates"""
 
+    __slots__ = ("lon", "lat", "hgt", "_enu_basis")
+
     def __init__(self, lon: float, lat: float, hgt: float = 0.0):
         """__init__ Constructor of class:`GeoCoords` class
 
@@ -46,6 +75,7 @@ class GeoCoords:
         self.lon = lon
         self.lat = lat
         self.hgt = hgt
+        self._enu_basis = None
 
     def __str__(self) -> str:
         """__str__ Transform the object in string
@@ -58,29 +88,22 @@ class GeoCoords:
         return output
 
     def copy(self) -> GeoCoords:
-        return copy.deepcopy(self)
+        """copy Copy the current object
+
+        :return: A copy of current object
+        """
+        if isinstance(self.lon, np.ndarray):
+            return GeoCoords(self.lon.copy(), self.lat.copy(), self.hgt.copy())
+        return GeoCoords(self.lon, self.lat, self.hgt)
 
     def toECEFCoords(self) -> ECEFCoords:
         """toECEFCoords Convert geodetic coordinates to absolute ECEF
 
         :return: absolute ECEF coordinates
         """
-
-        xyz = ECEFCoords(0.0, 0.0, 0.0)
-
-        e = math.sqrt(Fe * (2 - Fe))
-
-        lon = self.lon * math.pi / 180.0
-        lat = self.lat * math.pi / 180.0
-        hgt = self.hgt
-
-        n = Re / math.sqrt(1 - (e * math.sin(lat)) ** 2)
-
-        xyz.X = (n + hgt) * math.cos(lat) * math.cos(lon)
-        xyz.Y = (n + hgt) * math.cos(lat) * math.sin(lon)
-        xyz.Z = ((1 - e * e) * n + hgt) * math.sin(lat)
-
-        return xyz
+        if isinstance(self.lon, np.ndarray):
+            return ECEFCoords(*_geo2ecef_vec(self.lon, self.lat, self.hgt))
+        return ECEFCoords(*_geo2ecef(self.lon, self.lat, self.hgt))
 
     def toENUCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ENUCoords:
         """toENUCoords Convert geodetic coordinates to local ENU coords
@@ -91,9 +114,22 @@ class GeoCoords:
         # Special SRID projection
         if isinstance(base, int):
             return self.toProjCoords(base)
-        base_ecef = base.toECEFCoords()
-        point_ecef = self.toECEFCoords()
-        return point_ecef.toENUCoords(base_ecef)
+        return self.toECEFCoords().toENUCoords(base)
+
+    def _enuBasis(self) -> tuple:
+        """_enuBasis Parameters of the local ENU frame based on current point
+
+        Computed on first call, and then reused as long as point is unchanged.
+
+        :return: ECEF coordinates of the point and sine and cosine of its
+            longitude and latitude (see :func:`_makeENUBasis`)
+        """
+        b = self._enu_basis
+        if b is None or b[0] != self.lon or b[1] != self.lat or b[2] != self.hgt:
+            X0, Y0, Z0 = _geo2ecef(self.lon, self.lat, self.hgt)
+            basis = _makeENUBasis(X0, Y0, Z0, self.lon, self.lat)
+            b = self._enu_basis = (self.lon, self.lat, self.hgt, basis)
+        return b[3]
 
     def toGeoCoords(self) -> GeoCoords:
         """toGeoCoords Artificial function to ensure point is GeoCoords
@@ -116,7 +152,9 @@ class GeoCoords:
         :param point: Geographic coordinate
         :return: 2D Distance
         """
-        return self.toENUCoords(point).norm2D()
+        X, Y, Z = _geo2ecef(self.lon, self.lat, self.hgt)
+        E, N, U = _ecef2enu(X, Y, Z, point._enuBasis())
+        return math.hypot(E, N)
 
     def elevationTo(self, point: GeoCoords) -> float:
         """elevationTo Elevation between two geodetic coordinates
@@ -182,12 +220,16 @@ class GeoCoords:
         self.hgt = Z
 
     def plot(self, sym="ro"):
+        import matplotlib.pyplot as plt  # Imported on demand (costly import)
+
         plt.plot(self.lon, self.lat, sym)
 
 
 class ENUCoords:
     """Class for representation of local projection (East, North, Up)"""
 
+    __slots__ = ("E", "N", "U")
+
     def __init__(self, E: float, N: float, U: float = 0):
         """__init__ Constructor of class:`ENUCoords`  class
 
@@ -214,7 +256,9 @@ class ENUCoords:
 
         :return: A copy of current object
         """
-        return copy.deepcopy(self)
+        if isinstance(self.E, np.ndarray):
+            return ENUCoords(self.E.copy(), self.N.copy(), self.U.copy())
+        return ENUCoords(self.E, self.N, self.U)
 
     def toECEFCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ECEFCoords:
         """toECEFCoords Convert local planimetric to absolute geocentric
@@ -222,30 +266,7 @@ class ENUCoords:
         :param base: Base coordinates
         :return: Transformet coordinates
         """
-
-        base = base.toECEFCoords()
-
-        xyz = ECEFCoords(0.0, 0.0, 0.0)
-
-        e = self.E
-        n = self.N
-        u = self.U
-
-        base_geo = base.toGeoCoords()
-
-        blon = base_geo.lon * math.pi / 180.0
-        blat = base_geo.lat * math.pi / 180.0
-
-        slon = math.sin(blon)
-        slat = math.sin(blat)
-        clon = math.cos(blon)
-        clat = math.cos(blat)
-
-        xyz.X = -e * slon - n * clon * slat + u * clon * clat + base.X
-        xyz.Y = e * clon - n * slon * slat + u * slon * clat + base.Y
-        xyz.Z = n * clat + u * slat + base.Z
-
-        return xyz
+        return ECEFCoords(*_enu2ecef(self.E, self.N, self.U, base._enuBasis()))
 
     def toGeoCoords(self, base: Union[ECEFCoords, GeoCoords]) -> GeoCoords:
         """toGeoCoords Convert local ENU coordinates to geo coords
@@ -256,9 +277,7 @@ class ENUCoords:
         # Special SRID projection
         if isinstance(base, int):
             return _unproj(self, base)
-        base_ecef = base.toECEFCoords()
-        point_ecef = self.toECEFCoords(base_ecef)
-        return point_ecef.toGeoCoords()
+        return self.toECEFCoords(base).toGeoCoords()
 
     def toENUCoords(
         self, base1: Union[ECEFCoords, GeoCoords], base2: Union[ECEFCoords, GeoCoords]
@@ -270,24 +289,21 @@ class ENUCoords:
         :param base2: Base 2 coordinates
         :return: Transformed coordinates
         """
-        base_ecef1 = base1.toECEFCoords()
-        base_ecef2 = base2.toECEFCoords()
-        point_ecef = self.toECEFCoords(base_ecef1)
-        return point_ecef.toENUCoords(base_ecef2)
+        return self.toECEFCoords(base1).toENUCoords(base2)
 
     def norm2D(self) -> float:
         """norm2D Planimetric euclidian norm of point
 
         :return: Euclidian norm
         """
-        return math.sqrt(self.E ** 2 + self.N ** 2)
+        return math.hypot(self.E, self.N)
 
     def norm(self) -> float:
         """norm R^3 space euclidian norm of point
 
         :return: R^3 space euclidian norm of point
         """
-        return math.sqrt(self.E ** 2 + self.N ** 2 + self.U ** 2)
+        return math.sqrt(self.E * self.E + self.N * self.N + self.U * self.U)
 
     def dot(self, point):
         """dot Dot product between two vectors
@@ -304,8 +320,9 @@ class ENUCoords:
         :param point: A ENUCoordinate
         :return: Elevation (in rad)
         """
-        visee = point - self
-        return math.atan2(visee.U, visee.norm2D())
+        dE = point.E - self.E
+        dN = point.N - self.N
+        return math.atan2(point.U - self.U, math.hypot(dE, dN))
 
     def azimuthTo(self, point: ENUCoords) -> float:
         """azimuthTo Azimut between two ENU coordinates
@@ -313,8 +330,7 @@ class ENUCoords:
         :param point: A ENUCoordinate
         :return: Azimut (in rad)
         """
-        visee = point - self
-        return math.atan2(visee.E, visee.N)
+        return math.atan2(point.E - self.E, point.N - self.N)
 
     def __sub__(self, p: ENUCoords) -> ENUCoords:
         """__sub__ Vector difference between two ENU coordinates
@@ -322,7 +338,7 @@ class ENUCoords:
         :param p: An ENU coordinate
         :return: An ENU coordinate
         """
-        return ENUCoords(p.E - self.E, p.N - self.N, p.U - self.U)
+        return ENUCoords(self.E - p.E, self.N - p.N, self.U - p.U)
 
     def __add__(self, p: ENUCoords) -> ENUCoords:
         """__add__ Vector addition between two ENU coordinates
@@ -330,7 +346,7 @@ class ENUCoords:
         :param p: An ENU coordinate
         :return: An ENU coordinate
         """
-        return ENUCoords(p.E + self.E, p.N + self.N, p.U + self.U)
+        return ENUCoords(self.E + p.E, self.N + p.N, self.U + p.U)
 
     def distance2DTo(self, point: ENUCoords) -> float:
         """distance2DTo Distance 2D between two ENU coordinates
@@ -338,15 +354,20 @@ class ENUCoords:
         :param point: A ENU coordinate
         :return: 2D distance
         """
-        return (point - self).norm2D()
+        dE = point.E - self.E
+        dN = point.N - self.N
+        return math.sqrt(dE * dE + dN * dN)
 
     def distanceTo(self, point: ENUCoords) -> float:
         """distanceTo Distance 3D between two ENU coordinates
 
         :param point: A ENU coordinate
-        :return: 2D distance
+        :return: 3D distance
         """
-        return (point - self).norm()
+        dE = point.E - self.E
+        dN = point.N - self.N
+        dU = point.U - self.U
+        return math.sqrt(dE * dE + dN * dN + dU * dU)
 
     def rotate(self, theta: float):
         """rotate Rotation (2D) of point
@@ -416,12 +437,16 @@ class ENUCoords:
         self.U = Z
 
     def plot(self, sym="ro"):
+        import matplotlib.pyplot as plt  # Imported on demand (costly import)
+
         plt.plot(self.E, self.N, sym)
 
 
 class ECEFCoords:
     """Class to represent Earth-Centered-Earth-Fixed coordinates"""
 
+    __slots__ = ("X", "Y", "Z", "_enu_basis")
+
     # --------------------------------------------------
     # X, Y, Z in meters
     # --------------------------------------------------
@@ -435,6 +460,7 @@ class ECEFCoords:
         self.X = X
         self.Y = Y
         self.Z = Z
+        self._enu_basis = None
 
     def __str__(self) -> str:
         """__str__ Transform the object in string
@@ -451,38 +477,18 @@ class ECEFCoords:
 
         :return: A copy of current object
         """
-        return copy.deepcopy(self)
+        if isinstance(self.X, np.ndarray):
+            return ECEFCoords(self.X.copy(), self.Y.copy(), self.Z.copy())
+        return ECEFCoords(self.X, self.Y, self.Z)
 
     def toGeoCoords(self) -> GeoCoords:
         """toGeoCoords Convert absolute geocentric coords to geodetic longitude, latitude and height
 
         :return: GeoCoords representation of current coordinates
         """
-
-        geo = GeoCoords(0.0, 0.0, 0.0)
-
-        b = Re * (1 - Fe)
-        e = math.sqrt(Fe * (2 - Fe))
-
-        X = self.X
-        Y = self.Y
-        Z = self.Z
-
-        h = Re * Re - b * b
-        p = math.sqrt(X * X + Y * Y)
-        t = math.atan2(Z * Re, p * b)
-
-        geo.lon = math.atan2(Y, X)
-        geo.lat = math.atan2(
-            Z + h / b * pow(math.sin(t), 3), p - h / Re * (math.cos(t)) ** 3
-        )
-        n = Re / math.sqrt(1 - (e * math.sin(geo.lat)) ** 2)
-        geo.hgt = (p / math.cos(geo.lat)) - n
-
-        geo.lon *= 180.0 / math.pi
-        geo.lat *= 180.0 / math.pi
-
-        return geo
+        if isinstance(self.X, np.ndarray):
+            return GeoCoords(*_ecef2geo_vec(self.X, self.Y, self.Z))
+        return GeoCoords(*_ecef2geo(self.X, self.Y, self.Z))
 
     def toENUCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ENUCoords:
         """toENUCoords Convert local coordinates to absolute geocentric
@@ -490,30 +496,22 @@ class ECEFCoords:
         :param base: Base coordinates
         :return: Transformed coordinates
         """
+        return ENUCoords(*_ecef2enu(self.X, self.Y, self.Z, base._enuBasis()))
 
-        base = base.toECEFCoords()
-
-        enu = ENUCoords(0.0, 0.0, 0.0)
+    def _enuBasis(self) -> tuple:
+        """_enuBasis Parameters of the local ENU frame based on current point
 
-        base_geo = base.toGeoCoords()
+        Computed on first call, and then reused as long as point is unchanged.
 
-        blon = base_geo.lon * math.pi / 180.0
-        blat = base_geo.lat * math.pi / 180.0
-
-        x = self.X - base.X
-        y = self.Y - base.Y
-        z = self.Z - base.Z
-
-        slon = math.sin(blon)
-        slat = math.sin(blat)
-        clon = math.cos(blon)
-        clat = math.cos(blat)
-
-        enu.E = -x * slon + y * clon
-        enu.N = -x * clon * slat - y * slon * slat + z * clat
-        enu.U = x * clon * clat + y * slon * clat + z * slat
-
-        return enu
+        :return: ECEF coordinates of the point and sine and cosine of its
+            longitude and latitude (see :func:`_makeENUBasis`)
+        """
+        b = self._enu_basis
+        if b is None or b[0] != self.X or b[1] != self.Y or b[2] != self.Z:
+            lon0, lat0, hgt0 = _ecef2geo(self.X, self.Y, self.Z)
+            basis = _makeENUBasis(self.X, self.Y, self.Z, lon0, lat0)
+            b = self._enu_basis = (self.X, self.Y, self.Z, basis)
+        return b[3]
 
     def toECEFCoords(self) -> ECEFCoords:
         """toECEFCoords Artificial function to ensure point is ECEFCoords
@@ -566,15 +564,15 @@ class ECEFCoords:
         :param p: Corrdinate 2
         :return: Result of substration
         """
-        return ECEFCoords(p.X - self.X, p.Y - self.Y, p.Z - self.Z)
+        return ECEFCoords(self.X - p.X, self.Y - p.Y, self.Z - p.Z)
 
     def __add__(self, p: ECEFCoords) -> ECEFCoords:
-        """__sub__ Vector sum between two ECEF coordinates
+        """__add__ Vector sum between two ECEF coordinates
 
         :param p: Corrdinate 2
         :return: Result of sum
         """
-        return ECEFCoords(p.X + self.X, p.Y + self.Y, p.Z + self.Z)
+        return ECEFCoords(self.X + p.X, self.Y + p.Y, self.Z + p.Z)
 
     def distanceTo(self, point: ECEFCoords) -> float:
         """distanceTo Distance between two ECEF coordinates
@@ -582,7 +580,10 @@ class ECEFCoords:
         :param point: Corrdinate 2
         :return: Distance (meters)
         """
-        return (point - self).norm()
+        dX = point.X - self.X
+        dY = point.Y - self.Y
+        dZ = point.Z - self.Z
+        return math.sqrt(dX * dX + dY * dY + dZ * dZ)
 
     def getX(self) -> float:
         """getX Return the X coordinate"""
@@ -618,176 +619,763 @@ class ECEFCoords:
         self.Z = Z
 
 
+# --------------------------------------------------
+# Scalar conversion kernels
+# --------------------------------------------------
+# Free functions on plain floats, called by the methods of Coords classes.
+def _geo2ecef(lon: float, lat: float, hgt: float) -> tuple[float, float, float]:
+    """Convert geodetic coordinates to absolute ECEF
+
+    :param lon: longitude in decimal degrees
+    :param lat: latitude in decimal degrees
+    :param hgt: height in meters
+    :return: X, Y, Z (meters)
+    """
+    lon = math.radians(lon)
+    lat = math.radians(lat)
+
+    slon = math.sin(lon)
+    clon = math.cos(lon)
+    slat = math.sin(lat)
+    clat = math.cos(lat)
+
+    n = Re / math.sqrt(1 - _E2 * slat * slat)
+
+    X = (n + hgt) * clat * clon
+    Y = (n + hgt) * clat * slon
+    Z = ((1 - _E2) * n + hgt) * slat
+
+    return X, Y, Z
+
+
+def _ecef2geo(X: float, Y: float, Z: float) -> tuple[float, float, float]:
+    """Convert absolute ECEF coordinates to geodetic coordinates
+
+    :param X: X coordinate (meters)
+    :param Y: Y coordinate (meters)
+    :param Z: Z coordinate (meters)
+    :return: lon, lat (decimal degrees), hgt (meters)
+    """
+    if ECEF2GEO_OLSON:
+        return _ecef2geo_olson(X, Y, Z)
+    return _ecef2geo_bowring(X, Y, Z)
+
+
+def _ecef2geo_bowring(X: float, Y: float, Z: float) -> tuple[float, float, float]:
+    """ECEF to geodetic conversion with Bowring's formula (single iteration)
+
+    :param X: X coordinate (meters)
+    :param Y: Y coordinate (meters)
+    :param Z: Z coordinate (meters)
+    :return: lon, lat (decimal degrees), hgt (meters)
+    """
+    p = math.sqrt(X * X + Y * Y)
+    t = math.atan2(Z * Re, p * _B)
+
+    lon = math.atan2(Y, X)
+    st = math.sin(t)
+    ct = math.cos(t)
+    lat = math.atan2(Z + _H / _B * st * st * st, p - _H / Re * ct * ct * ct)
+    slat = math.sin(lat)
+    n = Re / math.sqrt(1 - _E2 * slat * slat)
+    hgt = (p / math.cos(lat)) - n
+
+    return math.degrees(lon), math.degrees(lat), hgt
+
+
+def _ecef2geo_olson(X: float, Y: float, Z: float) -> tuple[float, float, float]:
+    """ECEF to geodetic conversion with Olson's closed-form formula
+
+    D. K. Olson, Converting Earth-Centered, Earth-Fixed Coordinates to
+    Geodetic Coordinates, IEEE Transactions on Aerospace and Electronic
+    Systems, 32 (1996) 473-476.
+
+    :param X: X coordinate (meters)
+    :param Y: Y coordinate (meters)
+    :param Z: Z coordinate (meters)
+    :return: lon, lat (decimal degrees), hgt (meters)
+    """
+    zp = abs(Z)
+    w2 = X * X + Y * Y
+    w = math.sqrt(w2)
+    z2 = Z * Z
+    r2 = w2 + z2
+    if r2 < _OLSON_RMIN * _OLSON_RMIN:
+        return _ecef2geo_bowring(X, Y, Z)
+    r = math.sqrt(r2)
+
+    lon = math.atan2(Y, X)
+
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = _OLSON_A2 / r
+    v = _OLSON_A3 - _OLSON_A4 / r
+
+    if c2 > 0.3:
+        s = (zp / r) * (1.0 + c2 * (_OLSON_A1 + u + s2 * v) / r)
+        lat = math.asin(s)
+        ss = s * s
+        c = math.sqrt(1.0 - ss)
+    else:
+        c = (w / r) * (1.0 - s2 * (_OLSON_A5 - u - c2 * v) / r)
+        lat = math.acos(c)
+        ss = 1.0 - c * c
+        s = math.sqrt(ss)
+
+    g = 1.0 - _E2 * ss
+    rg = Re / math.sqrt(g)
+    rf = _OLSON_A6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+
+    lat = lat + p
+    hgt = f + m * p / 2.0
+    if Z < 0.0:
+        lat = -lat
+
+    return math.degrees(lon), math.degrees(lat), hgt
+
+
+def _makeENUBasis(X0: float, Y0: float, Z0: float, lon0: float, lat0: float):
+    """Parameters of a local ENU frame
+
+    :param X0: X coordinate of base (meters)
+    :param Y0: Y coordinate of base (meters)
+    :param Z0: Z coordinate of base (meters)
+    :param lon0: longitude of base (decimal degrees)
+    :param lat0: latitude of base (decimal degrees)
+    :return: (X0, Y0, Z0, slon, clon, slat, clat) with sine and cosine of
+        longitude and latitude of base
+    """
+    blon = math.radians(lon0)
+    blat = math.radians(lat0)
+    slon, clon = math.sin(blon), math.cos(blon)
+    slat, clat = math.sin(blat), math.cos(blat)
+    return X0, Y0, Z0, slon, clon, slat, clat
+
+
+def _ecef2enu(X, Y, Z, basis: tuple):
+    """Convert absolute ECEF coordinates to local ENU coordinates
+
+    :param X: X coordinate (meters)
+    :param Y: Y coordinate (meters)
+    :param Z: Z coordinate (meters)
+    :param basis: Parameters of ENU frame (see :func:`_makeENUBasis`)
+    :return: E, N, U (meters)
+    """
+    X0, Y0, Z0, slon, clon, slat, clat = basis
+
+    x = X - X0
+    y = Y - Y0
+    z = Z - Z0
+
+    E = -x * slon + y * clon
+    N = -x * clon * slat - y * slon * slat + z * clat
+    U = x * clon * clat + y * slon * clat + z * slat
+
+    return E, N, U
+
+
+def _enu2ecef(E, N, U, basis: tuple):
+    """Convert local ENU coordinates to absolute ECEF coordinates
+
+    :param E: East coordinate (meters)
+    :param N: North coordinate (meters)
+    :param U: Up coordinate (meters)
+    :param basis: Parameters of ENU frame (see :func:`_makeENUBasis`)
+    :return: X, Y, Z (meters)
+    """
+    X0, Y0, Z0, slon, clon, slat, clat = basis
+
+    X = -E * slon - N * clon * slat + U * clon * clat + X0
+    Y = E * clon - N * slon * slat + U * slon * clat + Y0
+    Z = N * clat + U * slat + Z0
+
+    return X, Y, Z
+
+
+# --------------------------------------------------
+# Vectorized conversion functions
+# --------------------------------------------------
+# Coords objects hold one point each. The functions below apply the same
+# formulas on NumPy arrays, to convert whole tracks in a single pass. Coords
+# objects built on arrays (e.g. GeoCoords(lon_array, lat_array, hgt_array))
+# are dispatched to these functions by their conversion methods.
+def _geo2ecef_vec(lon, lat, hgt):
+    """Convert arrays of geodetic coordinates to absolute ECEF
+
+    :param lon: longitudes in decimal degrees
+    :param lat: latitudes in decimal degrees
+    :param hgt: heights in meters
+    :return: X, Y, Z arrays (meters)
+    """
+    lon = np.deg2rad(lon)
+    lat = np.deg2rad(lat)
+
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+
+    n = Re / np.sqrt(1 - _E2 * sin_lat * sin_lat)
+
+    X = (n + hgt) * cos_lat * np.cos(lon)
+    Y = (n + hgt) * cos_lat * np.sin(lon)
+    Z = ((1 - _E2) * n + hgt) * sin_lat
+
+    return X, Y, Z
+
+
+def _ecef2geo_vec(X, Y, Z):
+    """Convert arrays of absolute ECEF coordinates to geodetic coordinates
+
+    :param X: X coordinates (meters)
+    :param Y: Y coordinates (meters)
+    :param Z: Z coordinates (meters)
+    :return: lon, lat (decimal degrees), hgt (meters) arrays
+    """
+    if ECEF2GEO_OLSON:
+        return _ecef2geo_olson_vec(X, Y, Z)
+    return _ecef2geo_bowring_vec(X, Y, Z)
+
+
+def _ecef2geo_bowring_vec(X, Y, Z):
+    """Bowring's ECEF to geodetic conversion on arrays (see
+    :func:`_ecef2geo_bowring`)
+
+    :param X: X coordinates (meters)
+    :param Y: Y coordinates (meters)
+    :param Z: Z coordinates (meters)
+    :return: lon, lat (decimal degrees), hgt (meters) arrays
+    """
+    p = np.hypot(X, Y)
+    t = np.arctan2(Z * Re, p * _B)
+
+    lon = np.arctan2(Y, X)
+    st = np.sin(t)
+    ct = np.cos(t)
+    lat = np.arctan2(Z + _H / _B * st * st * st, p - _H / Re * ct * ct * ct)
+    sin_lat = np.sin(lat)
+    n = Re / np.sqrt(1 - _E2 * sin_lat * sin_lat)
+    hgt = p / np.cos(lat) - n
+
+    return np.rad2deg(lon), np.rad2deg(lat), hgt
+
+
+def _ecef2geo_olson_vec(X, Y, Z):
+    """Olson's ECEF to geodetic conversion on arrays (see :func:`_ecef2geo_olson`)
+
+    :param X: X coordinates (meters)
+    :param Y: Y coordinates (meters)
+    :param Z: Z coordinates (meters)
+    :return: lon, lat (decimal degrees), hgt (meters) arrays
+    """
+    X, Y, Z = np.broadcast_arrays(X, Y, Z)
+
+    zp = np.abs(Z)
+    w2 = X * X + Y * Y
+    w = np.sqrt(w2)
+    z2 = Z * Z
+    r2 = w2 + z2
+    # Points near the center of the Earth are computed with Bowring's formula
+    # below. Their radius is set to infinity, which keeps Olson's terms finite.
+    near = r2 < _OLSON_RMIN * _OLSON_RMIN
+    r2 = np.where(near, np.inf, r2)
+    r = np.sqrt(r2)
+
+    lon = np.arctan2(Y, X)
+
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = _OLSON_A2 / r
+    v = _OLSON_A3 - _OLSON_A4 / r
+
+    # Two formulations, depending on whether the point is near a pole or not
+    lat = np.empty_like(r)
+    s = np.empty_like(r)
+    c = np.empty_like(r)
+    ss = np.empty_like(r)
+
+    k = c2 > 0.3
+    s[k] = (zp[k] / r[k]) * (1.0 + c2[k] * (_OLSON_A1 + u[k] + s2[k] * v[k]) / r[k])
+    lat[k] = np.arcsin(s[k])
+    ss[k] = s[k] * s[k]
+    c[k] = np.sqrt(1.0 - ss[k])
+
+    k = ~k
+    c[k] = (w[k] / r[k]) * (1.0 - s2[k] * (_OLSON_A5 - u[k] - c2[k] * v[k]) / r[k])
+    lat[k] = np.arccos(c[k])
+    ss[k] = 1.0 - c[k] * c[k]
+    s[k] = np.sqrt(ss[k])
+
+    g = 1.0 - _E2 * ss
+    rg = Re / np.sqrt(g)
+    rf = _OLSON_A6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+
+    lat = np.copysign(lat + p, Z)
+    hgt = f + m * p / 2.0
+    lon = np.rad2deg(lon)
+    lat = np.rad2deg(lat)
+
+    # Points near the center of the Earth: Bowring's formula
+    if near.any():
+        lon, lat, hgt = np.asarray(lon), np.asarray(lat), np.asarray(hgt)
+        lon[near], lat[near], hgt[near] = _ecef2geo_bowring_vec(
+            X[near], Y[near], Z[near]
+        )
+
+    return lon, lat, hgt
+
+
+def _ecef2enu_vec(X, Y, Z, base: Union[ECEFCoords, GeoCoords]):
+    """Convert arrays of absolute ECEF coordinates to local ENU coordinates
+
+    :param X: X coordinates (meters)
+    :param Y: Y coordinates (meters)
+    :param Z: Z coordinates (meters)
+    :param base: Base coordinates (a single point)
+    :return: E, N, U arrays (meters)
+    """
+    return _ecef2enu(X, Y, Z, base._enuBasis())
+
+
+def _enu2ecef_vec(E, N, U, base: Union[ECEFCoords, GeoCoords]):
+    """Convert arrays of local ENU coordinates to absolute ECEF coordinates
+
+    :param E: East coordinates (meters)
+    :param N: North coordinates (meters)
+    :param U: Up coordinates (meters)
+    :param base: Base coordinates (a single point)
+    :return: X, Y, Z arrays (meters)
+    """
+    return _enu2ecef(E, N, U, base._enuBasis())
+
+
+def geo2ecef(lon, lat, hgt=0.0):
+    """Convert geodetic coordinates of many points to absolute ECEF
+
+    :param lon: longitudes in decimal degrees (array-like)
+    :param lat: latitudes in decimal degrees (array-like)
+    :param hgt: heights in meters (array-like), defaults to 0
+    :return: X, Y, Z numpy arrays (meters)
+    """
+    return _geo2ecef_vec(
+        np.asarray(lon, dtype=np.float64),
+        np.asarray(lat, dtype=np.float64),
+        np.asarray(hgt, dtype=np.float64),
+    )
+
+
+def ecef2geo(X, Y, Z):
+    """Convert absolute ECEF coordinates of many points to geodetic coordinates
+
+    :param X: X coordinates in meters (array-like)
+    :param Y: Y coordinates in meters (array-like)
+    :param Z: Z coordinates in meters (array-like)
+    :return: lon, lat (decimal degrees), hgt (meters) numpy arrays
+    """
+    return _ecef2geo_vec(
+        np.asarray(X, dtype=np.float64),
+        np.asarray(Y, dtype=np.float64),
+        np.asarray(Z, dtype=np.float64),
+    )
+
+
+def ecef2enu(X, Y, Z, base: Union[ECEFCoords, GeoCoords]):
+    """Convert absolute ECEF coordinates of many points to local ENU coordinates
+
+    :param X: X coordinates in meters (array-like)
+    :param Y: Y coordinates in meters (array-like)
+    :param Z: Z coordinates in meters (array-like)
+    :param base: Base coordinates
+    :return: E, N, U numpy arrays (meters)
+    """
+    return _ecef2enu_vec(
+        np.asarray(X, dtype=np.float64),
+        np.asarray(Y, dtype=np.float64),
+        np.asarray(Z, dtype=np.float64),
+        base,
+    )
+
+
+def enu2ecef(E, N, U, base: Union[ECEFCoords, GeoCoords]):
+    """Convert local ENU coordinates of many points to absolute ECEF coordinates
+
+    :param E: East coordinates in meters (array-like)
+    :param N: North coordinates in meters (array-like)
+    :param U: Up coordinates in meters (array-like)
+    :param base: Base coordinates
+    :return: X, Y, Z numpy arrays (meters)
+    """
+    return _enu2ecef_vec(
+        np.asarray(E, dtype=np.float64),
+        np.asarray(N, dtype=np.float64),
+        np.asarray(U, dtype=np.float64),
+        base,
+    )
+
+
+def rotateAll(points: list[ENUCoords], theta: float):
+    """rotateAll Rotation (2D) of many points by a same angle
+
+    Equivalent to calling :meth:`ENUCoords.rotate` on each point, with cosine
+    and sine of angle computed once.
+
+    :param points: A list of ENU coordinates (modified in place)
+    :param theta: Angle of rotation (in rad)
+    """
+    cr = math.cos(theta)
+    sr = math.sin(theta)
+    for p in points:
+        xr = +cr * p.E - sr * p.N
+        yr = +sr * p.E + cr * p.N
+        p.E = xr
+        p.N = yr
+
+
 # --------------------------------------------------
 # Static projection methods
 # --------------------------------------------------
 def _proj(coords, srid: int):
-    if srid == 2154:
-        return _projToLambert93(coords)
-    print("Error: SRID code " + str(srid) + " is not implmented in Tracklib")
-    exit()
+    """Project geographic coordinates with a SRID of :data:`_PROJ_FORWARD`"""
+    try:
+        projection = _PROJ_FORWARD[srid]
+    except KeyError:
+        raise KeyError(
+            "SRID code " + str(srid) + " is not implemented in Tracklib"
+        ) from None
+    return projection(coords)
 
 
 def _unproj(coords, srid: int):
-    if srid == 2154:
-        return __projFromLambert93(coords)
-    if (srid >= 32600) and (srid <= 32799):
-        zone = (srid - 32600) % 100
-        north = srid < 32700
-        return _projFromUTM(coords, zone, north)
-    print("Error: SRID code " + str(srid) + " is not implmented in Tracklib")
-    exit()
+    """Unproject coordinates with a SRID of :data:`_PROJ_INVERSE`"""
+    try:
+        projection = _PROJ_INVERSE[srid]
+    except KeyError:
+        raise KeyError(
+            "SRID code " + str(srid) + " is not implemented in Tracklib"
+        ) from None
+    return projection(coords)
 
 
 def __projFromLambert93(coords) -> GeoCoords:
-
-    E = 0.08181919106
-    Xp = 700000.000
-    Yp = 12655612.050
-    n = 0.725607765053267
-    C = 11754255.4260960
-    lambda0 = 0.0523598775598299
     X = coords.getX()
-    Y = coords.getY()
-    lon = math.atan(-(X - Xp) / (Y - Yp)) / n + lambda0
-    latiso = -math.log(math.sqrt((X - Xp) ** 2 + (Y - Yp) ** 2) / C) / n
+    if isinstance(X, np.ndarray):
+        lon, lat = _lamb932geo_vec(X, coords.getY())
+    else:
+        lon, lat = _lamb932geo(X, coords.getY())
+    return GeoCoords(lon, lat, coords.getZ())
+
+
+def _projToLambert93(coords) -> ENUCoords:
+    lon = coords.getX()
+    if isinstance(lon, np.ndarray):
+        X, Y = _geo2lamb93_vec(lon, coords.getY())
+    else:
+        X, Y = _geo2lamb93(lon, coords.getY())
+    return ENUCoords(X, Y, coords.getZ())
+
+
+# Lambert 93 projection constants
+_L93_E = 0.08181919106  # First eccentricity of GRS80 ellipsoid
+_L93_XP = 700000.000  # Coordinates of pole
+_L93_YP = 12655612.050
+_L93_N = 0.725607765053267  # Projection exponent
+_L93_C = 11754255.4260960  # Projection constant
+_L93_LAMBDA0 = 0.0523598775598299  # Central meridian (3 deg East)
+
 
-    phi = 2 * math.atan(math.exp(latiso)) - math.pi / 2
+def _lamb932geo(X: float, Y: float) -> tuple[float, float]:
+    """Inverse Lambert 93 projection
+
+    :param X: Easting (meters)
+    :param Y: Northing (meters)
+    :return: lon, lat (decimal degrees)
+    """
+    E = _L93_E
+    n = _L93_N
+
+    dx = X - _L93_XP
+    dy = Y - _L93_YP
+    lon = math.atan(-dx / dy) / n + _L93_LAMBDA0
+    latiso = -math.log(math.sqrt(dx * dx + dy * dy) / _L93_C) / n
+
+    # Fixed point iteration on isometric latitude (converges in a few steps)
+    exp_latiso = math.exp(latiso)
+    phi = 2 * math.atan(exp_latiso) - math.pi / 2
     for i in range(10):
-        phi = 2 * math.atan(
-            ((1 + E * math.sin(phi)) / (1 - E * math.sin(phi))) ** (E / 2)
-            * math.exp(latiso)
-        )
+        sphi = E * math.sin(phi)
+        phi_prev = phi
+        phi = 2 * math.atan(((1 + sphi) / (1 - sphi)) ** (E / 2) * exp_latiso)
         phi -= math.pi / 2
+        if abs(phi - phi_prev) < 1e-12:
+            break
 
-    return GeoCoords(lon * 180 / math.pi, phi * 180 / math.pi, coords.getZ())
+    return math.degrees(lon), math.degrees(phi)
 
 
-def _projToLambert93(coords) -> ENUCoords:
+def _geo2lamb93(lon: float, lat: float) -> tuple[float, float]:
+    """Lambert 93 projection
 
-    E = 0.08181919106
-    Xp = 700000.000
-    Yp = 12655612.050
-    n = 0.725607765053267
-    C = 11754255.4260960
-    lambda0 = 0.0523598775598299
+    :param lon: longitude (decimal degrees)
+    :param lat: latitude (decimal degrees)
+    :return: X, Y (meters)
+    """
+    E = _L93_E
+    n = _L93_N
 
-    lon = coords.getX() * math.pi / 180.0
-    phi = coords.getY() * math.pi / 180.0
+    lon = math.radians(lon)
+    phi = math.radians(lat)
 
-    latiso = ((1 - E * math.sin(phi)) / (1 + E * math.sin(phi))) ** (E / 2)
+    sphi = E * math.sin(phi)
+    latiso = ((1 - sphi) / (1 + sphi)) ** (E / 2)
     latiso = math.tan(math.pi / 4 + phi / 2) * latiso
     latiso = math.log(latiso)
 
-    X = Xp + C * math.exp(-n * latiso) * math.sin(n * (lon - lambda0))
-    Y = Yp - C * math.exp(-n * latiso) * math.cos(n * (lon - lambda0))
+    R = _L93_C * math.exp(-n * latiso)
+    gamma = n * (lon - _L93_LAMBDA0)
 
-    return ENUCoords(X, Y, coords.getZ())
+    X = _L93_XP + R * math.sin(gamma)
+    Y = _L93_YP - R * math.cos(gamma)
 
+    return X, Y
 
-# --------------------------------------------------------------------------
-# Copyright (C) 2012 Tobias Bieniek <Tobias.Bieniek@gmx.de>
-# Permission is hereby granted, free of charge, to any person obtaining a
-# copy of this software and associated documentation files (the "Software"),
-# to deal in the Software without restriction, including without limitation
-# the rights to use, copy, modify, merge, publish, distribute, sublicense,
-# and/or sell copies of the Software, and to permit persons to whom the
-# Software is furnished to do so, subject to the following conditions:
-# The above copyright notice and this permission notice shall be included in
-#  all copies or substantial portions of the Software.
-# --------------------------------------------------------------------------
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
-# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-# DEALINGS IN THE SOFTWARE.
-# --------------------------------------------------------------------------
-def _projFromUTM(coords, zone, northern=True):
 
-    x = coords.getX() - 500000
-    y = coords.getY()
+def _lamb932geo_vec(X, Y):
+    """Inverse Lambert 93 projection on arrays (see :func:`_lamb932geo`)
 
-    zone_number_to_central_longitude = (zone - 1) * 6 - 180 + 3
+    :param X: Eastings (meters)
+    :param Y: Northings (meters)
+    :return: lon, lat arrays (decimal degrees)
+    """
+    E = _L93_E
+    n = _L93_N
 
-    if not northern:
-        y -= 10000000
+    dx = X - _L93_XP
+    dy = Y - _L93_YP
+    lon = np.arctan(-dx / dy) / n + _L93_LAMBDA0
+    latiso = -np.log(np.hypot(dx, dy) / _L93_C) / n
+
+    # Fixed point iteration on the whole array: all points converge in about
+    # the same number of steps, so masking converged rows does not pay off
+    exp_latiso = np.exp(latiso)
+    phi = 2 * np.arctan(exp_latiso) - math.pi / 2
+    for i in range(10):
+        sphi = E * np.sin(phi)
+        phi_prev = phi
+        phi = 2 * np.arctan(((1 + sphi) / (1 - sphi)) ** (E / 2) * exp_latiso)
+        phi -= math.pi / 2
+        if np.max(np.abs(phi - phi_prev), initial=0.0) < 1e-12:
+            break
 
-    K0 = 0.9996
-
-    E = 0.00669438
-    E2 = E * E
-    E3 = E2 * E
-    E_P2 = E / (1.0 - E)
-
-    SQRT_E = math.sqrt(1 - E)
-    _E = (1 - SQRT_E) / (1 + SQRT_E)
-    _E2 = _E * _E
-    _E3 = _E2 * _E
-    _E4 = _E3 * _E
-    _E5 = _E4 * _E
-
-    M1 = 1 - E / 4 - 3 * E2 / 64 - 5 * E3 / 256
-    M2 = 3 * E / 8 + 3 * E2 / 32 + 45 * E3 / 1024
-    M3 = 15 * E2 / 256 + 45 * E3 / 1024
-    M4 = 35 * E3 / 3072
-
-    P2 = 3.0 / 2 * _E - 27.0 / 32 * _E3 + 269.0 / 512 * _E5
-    P3 = 21.0 / 16 * _E2 - 55.0 / 32 * _E4
-    P4 = 151.0 / 96 * _E3 - 417.0 / 128 * _E5
-    P5 = 1097.0 / 512 * _E4
-    R = 6378137
-
-    m = y / K0
-    mu = m / (R * M1)
-
-    p_rad = (
-        mu
-        + P2 * math.sin(2 * mu)
-        + P3 * math.sin(4 * mu)
-        + P4 * math.sin(6 * mu)
-        + P5 * math.sin(8 * mu)
+    return np.rad2deg(lon), np.rad2deg(phi)
+
+
+def _geo2lamb93_vec(lon, lat):
+    """Lambert 93 projection on arrays (see :func:`_geo2lamb93`)
+
+    :param lon: longitudes (decimal degrees)
+    :param lat: latitudes (decimal degrees)
+    :return: X, Y arrays (meters)
+    """
+    E = _L93_E
+    n = _L93_N
+
+    lon = np.deg2rad(lon)
+    phi = np.deg2rad(lat)
+
+    sphi = E * np.sin(phi)
+    latiso = ((1 - sphi) / (1 + sphi)) ** (E / 2)
+    latiso = np.log(np.tan(math.pi / 4 + phi / 2) * latiso)
+
+    R = _L93_C * np.exp(-n * latiso)
+    gamma = n * (lon - _L93_LAMBDA0)
+
+    X = _L93_XP + R * np.sin(gamma)
+    Y = _L93_YP - R * np.cos(gamma)
+
+    return X, Y
+
+
+def lamb932geo(X, Y):
+    """Convert Lambert 93 coordinates of many points to geodetic coordinates
+
+    :param X: Eastings in meters (array-like)
+    :param Y: Northings in meters (array-like)
+    :return: lon, lat numpy arrays (decimal degrees)
+    """
+    return _lamb932geo_vec(
+        np.asarray(X, dtype=np.float64), np.asarray(Y, dtype=np.float64)
     )
 
-    p_sin = math.sin(p_rad)
-    p_sin2 = p_sin * p_sin
-    p_cos = math.cos(p_rad)
-
-    p_tan = p_sin / p_cos
-    p_tan2 = p_tan * p_tan
-    p_tan4 = p_tan2 * p_tan2
-
-    ep_sin = 1 - E * p_sin2
-    ep_sin_sqrt = math.sqrt(1 - E * p_sin2)
-
-    n = R / ep_sin_sqrt
-    r = (1 - E) / ep_sin
-    c = E_P2 * p_cos ** 2
-    c2 = c * c
-
-    d = x / (n * K0)
-    d2 = d * d
-    d3 = d2 * d
-    d4 = d3 * d
-    d5 = d4 * d
-    d6 = d5 * d
-
-    latitude = (
-        p_rad
-        - (p_tan / r)
-        * (d2 / 2 - d4 / 24 * (5 + 3 * p_tan2 + 10 * c - 4 * c2 - 9 * E_P2))
-        + d6 / 720 * (61 + 90 * p_tan2 + 298 * c + 45 * p_tan4 - 252 * E_P2 - 3 * c2)
+
+def geo2lamb93(lon, lat):
+    """Convert geodetic coordinates of many points to Lambert 93 coordinates
+
+    :param lon: longitudes in decimal degrees (array-like)
+    :param lat: latitudes in decimal degrees (array-like)
+    :return: X, Y numpy arrays (meters)
+    """
+    return _geo2lamb93_vec(
+        np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
     )
 
-    longitude = (
-        d
-        - d3 / 6 * (1 + 2 * p_tan2 + c)
-        + d5 / 120 * (5 - 2 * c + 28 * p_tan2 - 3 * c2 + 8 * E_P2 + 24 * p_tan4)
-    ) / p_cos
 
-    longitude = longitude + math.radians(
-        zone_number_to_central_longitude
-    )  # !!!! mod angle
+# UTM projection constants (Karney, 2011, "Transverse Mercator with an
+# accuracy of a few nanometers", J. Geodesy 85(8): 475-485)
+_UTM_K0 = 0.9996  # Scale factor on central meridian
+_UTM_N = Fe / (2 - Fe)  # Third flattening
+_UTM_N2 = _UTM_N * _UTM_N
+_UTM_N3 = _UTM_N2 * _UTM_N
+_UTM_N4 = _UTM_N3 * _UTM_N
+_UTM_N5 = _UTM_N4 * _UTM_N
+_UTM_N6 = _UTM_N5 * _UTM_N
+
+# Rectifying radius
+_UTM_A = Re / (1 + _UTM_N) * (1 + _UTM_N2 / 4 + _UTM_N4 / 64 + _UTM_N6 / 256)
+
+# Kruger series coefficients (6th order in n): beta for the (xi, eta) plane to
+# conformal sphere, delta for conformal latitude to geodetic latitude
+_UTM_BETA = (
+    _UTM_N / 2
+    - 2 * _UTM_N2 / 3
+    + 37 * _UTM_N3 / 96
+    - _UTM_N4 / 360
+    - 81 * _UTM_N5 / 512
+    + 96199 * _UTM_N6 / 604800,
+    _UTM_N2 / 48
+    + _UTM_N3 / 15
+    - 437 * _UTM_N4 / 1440
+    + 46 * _UTM_N5 / 105
+    - 1118711 * _UTM_N6 / 3870720,
+    17 * _UTM_N3 / 480
+    - 37 * _UTM_N4 / 840
+    - 209 * _UTM_N5 / 4480
+    + 5569 * _UTM_N6 / 90720,
+    4397 * _UTM_N4 / 161280 - 11 * _UTM_N5 / 504 - 830251 * _UTM_N6 / 7257600,
+    4583 * _UTM_N5 / 161280 - 108847 * _UTM_N6 / 3991680,
+    20648693 * _UTM_N6 / 638668800,
+)
+_UTM_DELTA = (
+    2 * _UTM_N
+    - 2 * _UTM_N2 / 3
+    - 2 * _UTM_N3
+    + 116 * _UTM_N4 / 45
+    + 26 * _UTM_N5 / 45
+    - 2854 * _UTM_N6 / 675,
+    7 * _UTM_N2 / 3
+    - 8 * _UTM_N3 / 5
+    - 227 * _UTM_N4 / 45
+    + 2704 * _UTM_N5 / 315
+    + 2323 * _UTM_N6 / 945,
+    56 * _UTM_N3 / 15
+    - 136 * _UTM_N4 / 35
+    - 1262 * _UTM_N5 / 105
+    + 73814 * _UTM_N6 / 2835,
+    4279 * _UTM_N4 / 630 - 332 * _UTM_N5 / 35 - 399572 * _UTM_N6 / 14175,
+    4174 * _UTM_N5 / 315 - 144838 * _UTM_N6 / 6237,
+    601676 * _UTM_N6 / 22275,
+)
+
+
+def _projFromUTM(coords, zone, northern=True):
+    x = coords.getX()
+    if isinstance(x, np.ndarray):
+        lon, lat = _utm2geo_vec(x, coords.getY(), zone, northern)
+    else:
+        lon, lat = _utm2geo(x, coords.getY(), zone, northern)
+    return GeoCoords(lon, lat, coords.getZ())
+
+
+def _clenshaw(coeffs: tuple, s2, c2):
+    """Sum of c_j * sin(2j * x) for j = 1..len(coeffs) (Clenshaw's algorithm)
+
+    Arithmetic only: x may be real or complex, scalar or NumPy array.
+
+    :param coeffs: Coefficients c_1, ..., c_k
+    :param s2: sin(2x)
+    :param c2: cos(2x)
+    :return: Sum of the series
+    """
+    y = 2 * c2
+    b1 = 0.0
+    b2 = 0.0
+    for c in reversed(coeffs):
+        b1, b2 = c + y * b1 - b2, b1
+    return b1 * s2
+
+
+def _utm2geo(x: float, y: float, zone: int, northern: bool = True):
+    """Inverse UTM projection (6th order Kruger series)
+
+    :param x: Easting (meters)
+    :param y: Northing (meters)
+    :param zone: UTM zone number
+    :param northern: True for northern hemisphere
+    :return: lon, lat (decimal degrees)
+    """
+    if not northern:
+        y -= 10000000
+
+    # Complex coordinate xi + i.eta on the ellipsoid plane, to sphere
+    zeta = complex(y, x - 500000) / (_UTM_K0 * _UTM_A)
+    zeta -= _clenshaw(_UTM_BETA, cmath.sin(2 * zeta), cmath.cos(2 * zeta))
+    xi = zeta.real
+    eta = zeta.imag
+
+    chi = math.asin(math.sin(xi) / math.cosh(eta))  # conformal latitude
+    lat = chi + _clenshaw(_UTM_DELTA, math.sin(2 * chi), math.cos(2 * chi))
+    lon = math.atan2(math.sinh(eta), math.cos(xi))
+
+    lon0 = (zone - 1) * 6 - 180 + 3  # !!!! mod angle
+    return math.degrees(lon) + lon0, math.degrees(lat)
+
+
+def _utm2geo_vec(x, y, zone: int, northern: bool = True):
+    """Inverse UTM projection on arrays (see :func:`_utm2geo`)
+
+    :param x: Eastings (meters)
+    :param y: Northings (meters)
+    :param zone: UTM zone number
+    :param northern: True for northern hemisphere
+    :return: lon, lat arrays (decimal degrees)
+    """
+    if not northern:
+        y = y - 10000000
+
+    zeta = (y + 1j * (x - 500000)) / (_UTM_K0 * _UTM_A)
+    zeta = zeta - _clenshaw(_UTM_BETA, np.sin(2 * zeta), np.cos(2 * zeta))
+    xi = zeta.real
+    eta = zeta.imag
+
+    chi = np.arcsin(np.sin(xi) / np.cosh(eta))
+    lat = chi + _clenshaw(_UTM_DELTA, np.sin(2 * chi), np.cos(2 * chi))
+    lon = np.arctan2(np.sinh(eta), np.cos(xi))
+
+    lon0 = (zone - 1) * 6 - 180 + 3
+    return np.rad2deg(lon) + lon0, np.rad2deg(lat)
+
+
+# --------------------------------------------------
+# SRID registry of projections
+# --------------------------------------------------
+def _utmInverse(zone: int, northern: bool):
+    """Inverse projection function of a UTM zone"""
+    return lambda coords: _projFromUTM(coords, zone, northern)
+
+
+# Geographic -> projected coordinates
+_PROJ_FORWARD = {2154: _projToLambert93}
 
-    return GeoCoords(longitude * 180 / math.pi, latitude * 180 / math.pi, coords.getZ())
+# Projected -> geographic coordinates
+_PROJ_INVERSE = {2154: __projFromLambert93}
+for _zone in range(1, 61):
+    _PROJ_INVERSE[32600 + _zone] = _utmInverse(_zone, True)  # WGS 84 / UTM N
+    _PROJ_INVERSE[32700 + _zone] = _utmInverse(_zone, False)  # WGS 84 / UTM S
+del _zone
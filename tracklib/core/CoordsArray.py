@@ -0,0 +1,370 @@
+"""
+This Module contains the classes to manage arrays of point coordinates:
+
+    - :class:`GeoArray` : Geographic coordinates (lon, lat, alti) of many points
+    - :class:`ENUArray` : Local projection (East, North, Up) of many points
+    - :class:`ECEFArray` : Earth-Centered-Earth-Fixed coordinates (X, Y, Z) of
+      many points
+
+Each class stores its three components in contiguous NumPy arrays (instead of
+one :mod:`tracklib.core.Coords` object per point), so that conversions and
+metrics on a whole track are computed in a few array operations. Methods have
+the same names as their :mod:`tracklib.core.Coords` counterparts. Bases of
+conversions are single point coordinates (:class:`GeoCoords` or
+:class:`ECEFCoords`).
+"""
+
+# For type annotation
+from __future__ import annotations
+from typing import Union
+
+import math
+import numpy as np
+
+from tracklib.core.Coords import GeoCoords, ENUCoords, ECEFCoords
+from tracklib.core.Coords import geo2ecef, ecef2geo, ecef2enu, enu2ecef
+
+
+def _array(values) -> np.ndarray:
+    """Convert values to a contiguous 1D array of float64"""
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+class GeoArray:
+    """Class to represent geographic coordinates of many points"""
+
+    __slots__ = ("lon", "lat", "hgt")
+
+    def __init__(self, lon, lat, hgt=None):
+        """__init__ Constructor of :class:`GeoArray` class
+
+        :param lon: longitudes in decimal degrees (array-like)
+        :param lat: latitudes in decimal degrees (array-like)
+        :param hgt: heights in meters (array-like), defaults to 0
+        """
+        self.lon = _array(lon)
+        self.lat = _array(lat)
+        self.hgt = np.zeros_like(self.lon) if hgt is None else _array(hgt)
+
+    @staticmethod
+    def fromList(points: list[GeoCoords]) -> GeoArray:
+        """fromList Build an array from a list of :class:`GeoCoords`
+
+        :param points: A list of geographic coordinates
+        :return: A :class:`GeoArray`
+        """
+        return GeoArray(
+            [p.lon for p in points], [p.lat for p in points], [p.hgt for p in points]
+        )
+
+    def toList(self) -> list[GeoCoords]:
+        """toList Convert to a list of :class:`GeoCoords`
+
+        :return: A list of geographic coordinates
+        """
+        return [GeoCoords(*c) for c in zip(*self.toTuple())]
+
+    def toTuple(self) -> tuple[list[float], list[float], list[float]]:
+        """toTuple Return components as lists of floats
+
+        :return: lon, lat and hgt lists
+        """
+        return self.lon.tolist(), self.lat.tolist(), self.hgt.tolist()
+
+    def __len__(self) -> int:
+        return len(self.lon)
+
+    def __getitem__(self, i: int) -> GeoCoords:
+        return GeoCoords(float(self.lon[i]), float(self.lat[i]), float(self.hgt[i]))
+
+    def copy(self) -> GeoArray:
+        """copy Copy the current object
+
+        :return: A copy of current object
+        """
+        return GeoArray(self.lon.copy(), self.lat.copy(), self.hgt.copy())
+
+    def toECEFCoords(self) -> ECEFArray:
+        """toECEFCoords Convert geodetic coordinates to absolute ECEF
+
+        :return: absolute ECEF coordinates
+        """
+        return ECEFArray(*geo2ecef(self.lon, self.lat, self.hgt))
+
+    def toENUCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ENUArray:
+        """toENUCoords Convert geodetic coordinates to local ENU coords
+
+        :param base: Base coordinates for conversion
+        :return: Converted coordinates
+        """
+        return self.toECEFCoords().toENUCoords(base)
+
+    def toGeoCoords(self) -> GeoArray:
+        """toGeoCoords Artificial function to ensure points are GeoArray
+
+        :return: Copy of current object
+        """
+        return self.copy()
+
+    def distanceTo(self, point: Union[GeoArray, GeoCoords]) -> np.ndarray:
+        """distanceTo Distances to geodetic coordinates
+
+        :param point: Geographic coordinate(s)
+        :return: Distances (meters)
+        """
+        return self.toECEFCoords().distanceTo(point.toECEFCoords())
+
+
+class ENUArray:
+    """Class to represent local projection coordinates of many points"""
+
+    __slots__ = ("E", "N", "U")
+
+    def __init__(self, E, N, U=None):
+        """__init__ Constructor of :class:`ENUArray` class
+
+        :param E: East coordinates in meters (array-like)
+        :param N: North coordinates in meters (array-like)
+        :param U: Elevations in meters (array-like), defaults to 0
+        """
+        self.E = _array(E)
+        self.N = _array(N)
+        self.U = np.zeros_like(self.E) if U is None else _array(U)
+
+    @staticmethod
+    def fromList(points: list[ENUCoords]) -> ENUArray:
+        """fromList Build an array from a list of :class:`ENUCoords`
+
+        :param points: A list of ENU coordinates
+        :return: An :class:`ENUArray`
+        """
+        return ENUArray(
+            [p.E for p in points], [p.N for p in points], [p.U for p in points]
+        )
+
+    def toList(self) -> list[ENUCoords]:
+        """toList Convert to a list of :class:`ENUCoords`
+
+        :return: A list of ENU coordinates
+        """
+        return [ENUCoords(*c) for c in zip(*self.toTuple())]
+
+    def toTuple(self) -> tuple[list[float], list[float], list[float]]:
+        """toTuple Return components as lists of floats
+
+        :return: E, N and U lists
+        """
+        return self.E.tolist(), self.N.tolist(), self.U.tolist()
+
+    def __len__(self) -> int:
+        return len(self.E)
+
+    def __getitem__(self, i: int) -> ENUCoords:
+        return ENUCoords(float(self.E[i]), float(self.N[i]), float(self.U[i]))
+
+    def copy(self) -> ENUArray:
+        """copy Copy the current object
+
+        :return: A copy of current object
+        """
+        return ENUArray(self.E.copy(), self.N.copy(), self.U.copy())
+
+    def toECEFCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ECEFArray:
+        """toECEFCoords Convert local planimetric to absolute geocentric
+
+        :param base: Base coordinates
+        :return: Transformed coordinates
+        """
+        return ECEFArray(*enu2ecef(self.E, self.N, self.U, base))
+
+    def toGeoCoords(self, base: Union[ECEFCoords, GeoCoords]) -> GeoArray:
+        """toGeoCoords Convert local ENU coordinates to geo coords
+
+        :param base: Base coordinates
+        :return: Transformed coordinates
+        """
+        return self.toECEFCoords(base).toGeoCoords()
+
+    def toENUCoords(
+        self, base1: Union[ECEFCoords, GeoCoords], base2: Union[ECEFCoords, GeoCoords]
+    ) -> ENUArray:
+        """toENUCoords Convert local ENU coordinates relative to base1 to
+        local ENU coordinates relative to base2.
+
+        :param base1: Base 1 coordinates
+        :param base2: Base 2 coordinates
+        :return: Transformed coordinates
+        """
+        return self.toECEFCoords(base1).toENUCoords(base2)
+
+    def norm2D(self) -> np.ndarray:
+        """norm2D Planimetric euclidian norms of points
+
+        :return: Euclidian norms
+        """
+        return np.hypot(self.E, self.N)
+
+    def norm(self) -> np.ndarray:
+        """norm R^3 space euclidian norms of points
+
+        :return: R^3 space euclidian norms
+        """
+        return np.sqrt(self.E * self.E + self.N * self.N + self.U * self.U)
+
+    def rotate(self, theta: float):
+        """rotate Rotation (2D) of points (in place)
+
+        :param theta: Angle of rotation (in rad)
+        """
+        cr = math.cos(theta)
+        sr = math.sin(theta)
+        E = cr * self.E - sr * self.N
+        self.N = sr * self.E + cr * self.N
+        self.E = E
+
+    def __sub__(self, p: Union[ENUArray, ENUCoords]) -> ENUArray:
+        """__sub__ Vector difference with ENU coordinate(s)
+
+        :param p: ENU coordinate(s)
+        :return: An :class:`ENUArray`
+        """
+        return ENUArray(self.E - p.E, self.N - p.N, self.U - p.U)
+
+    def __add__(self, p: Union[ENUArray, ENUCoords]) -> ENUArray:
+        """__add__ Vector addition with ENU coordinate(s)
+
+        :param p: ENU coordinate(s)
+        :return: An :class:`ENUArray`
+        """
+        return ENUArray(self.E + p.E, self.N + p.N, self.U + p.U)
+
+    def distance2DTo(self, point: Union[ENUArray, ENUCoords]) -> np.ndarray:
+        """distance2DTo 2D distances to ENU coordinate(s)
+
+        :param point: ENU coordinate(s)
+        :return: 2D distances
+        """
+        return np.hypot(point.E - self.E, point.N - self.N)
+
+    def distanceTo(self, point: Union[ENUArray, ENUCoords]) -> np.ndarray:
+        """distanceTo 3D distances to ENU coordinate(s)
+
+        :param point: ENU coordinate(s)
+        :return: 3D distances
+        """
+        dE = point.E - self.E
+        dN = point.N - self.N
+        dU = point.U - self.U
+        return np.sqrt(dE * dE + dN * dN + dU * dU)
+
+
+class ECEFArray:
+    """Class to represent Earth-Centered-Earth-Fixed coordinates of many points"""
+
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, X, Y, Z):
+        """__init__ Constructor of :class:`ECEFArray` class
+
+        :param X: X coordinates in meters (array-like)
+        :param Y: Y coordinates in meters (array-like)
+        :param Z: Z coordinates in meters (array-like)
+        """
+        self.X = _array(X)
+        self.Y = _array(Y)
+        self.Z = _array(Z)
+
+    @staticmethod
+    def fromList(points: list[ECEFCoords]) -> ECEFArray:
+        """fromList Build an array from a list of :class:`ECEFCoords`
+
+        :param points: A list of ECEF coordinates
+        :return: An :class:`ECEFArray`
+        """
+        return ECEFArray(
+            [p.X for p in points], [p.Y for p in points], [p.Z for p in points]
+        )
+
+    def toList(self) -> list[ECEFCoords]:
+        """toList Convert to a list of :class:`ECEFCoords`
+
+        :return: A list of ECEF coordinates
+        """
+        return [ECEFCoords(*c) for c in zip(*self.toTuple())]
+
+    def toTuple(self) -> tuple[list[float], list[float], list[float]]:
+        """toTuple Return components as lists of floats
+
+        :return: X, Y and Z lists
+        """
+        return self.X.tolist(), self.Y.tolist(), self.Z.tolist()
+
+    def __len__(self) -> int:
+        return len(self.X)
+
+    def __getitem__(self, i: int) -> ECEFCoords:
+        return ECEFCoords(float(self.X[i]), float(self.Y[i]), float(self.Z[i]))
+
+    def copy(self) -> ECEFArray:
+        """copy Copy the current object
+
+        :return: A copy of current object
+        """
+        return ECEFArray(self.X.copy(), self.Y.copy(), self.Z.copy())
+
+    def toGeoCoords(self) -> GeoArray:
+        """toGeoCoords Convert absolute geocentric coords to geodetic longitude,
+        latitude and height
+
+        :return: Geographic coordinates
+        """
+        return GeoArray(*ecef2geo(self.X, self.Y, self.Z))
+
+    def toENUCoords(self, base: Union[ECEFCoords, GeoCoords]) -> ENUArray:
+        """toENUCoords Convert absolute geocentric coords to local coordinates
+
+        :param base: Base coordinates
+        :return: Transformed coordinates
+        """
+        return ENUArray(*ecef2enu(self.X, self.Y, self.Z, base))
+
+    def toECEFCoords(self) -> ECEFArray:
+        """toECEFCoords Artificial function to ensure points are ECEFArray
+
+        :return: Copy of current object
+        """
+        return self.copy()
+
+    def norm(self) -> np.ndarray:
+        """norm R^3 space euclidian norms of points
+
+        :return: R^3 space euclidian norms
+        """
+        return np.sqrt(self.X * self.X + self.Y * self.Y + self.Z * self.Z)
+
+    def __sub__(self, p: Union[ECEFArray, ECEFCoords]) -> ECEFArray:
+        """__sub__ Vector difference with ECEF coordinate(s)
+
+        :param p: ECEF coordinate(s)
+        :return: An :class:`ECEFArray`
+        """
+        return ECEFArray(self.X - p.X, self.Y - p.Y, self.Z - p.Z)
+
+    def __add__(self, p: Union[ECEFArray, ECEFCoords]) -> ECEFArray:
+        """__add__ Vector sum with ECEF coordinate(s)
+
+        :param p: ECEF coordinate(s)
+        :return: An :class:`ECEFArray`
+        """
+        return ECEFArray(self.X + p.X, self.Y + p.Y, self.Z + p.Z)
+
+    def distanceTo(self, point: Union[ECEFArray, ECEFCoords]) -> np.ndarray:
+        """distanceTo Distances to ECEF coordinate(s)
+
+        :param point: ECEF coordinate(s)
+        :return: Distances (meters)
+        """
+        dx = point.X - self.X
+        dy = point.Y - self.Y
+        dz = point.Z - self.Z
+        return np.sqrt(dx * dx + dy * dy + dz * dz)
@@ -0,0 +1,182 @@
+"""
+This module contains a priority queue based on a hollow heap, with constant
+time insertion and decrease-key (Hansen, Kaplan, Tarjan & Zwick, 2017,
+"Hollow Heaps", ACM Transactions on Algorithms 13(3)).
+
+:class:`HollowHeap` is not a `dict`: it only supports the subset of
+:class:`tracklib.core.Utils.priority_dict` interface used as a priority queue,
+i.e. `len`, `in`, iteration on items, `heap[item]` (get, set and del),
+`setdefault`, `smallest`, `pop_smallest` and `sorted_iter`. Items are put
+into the queue with their respective priorities.
+"""
+
+# For type annotation
+from __future__ import annotations
+from typing import Any, Iterator
+
+
+_HOLLOW = object()  # Item of a hollow node
+
+
+class _Node:
+    """Node of a hollow heap"""
+
+    __slots__ = ("item", "key", "child", "next", "ep", "rank")
+
+    def __init__(self, item: Any, key: Any):
+        self.item = item
+        self.key = key
+        self.child = None  # First child
+        self.next = None  # Next sibling
+        self.ep = None  # Extra parent (hollow nodes of decrease-key only)
+        self.rank = 0
+
+
+def _link(v: _Node, w: _Node) -> _Node:
+    """Make the root with the larger key a child of the other one
+
+    :return: The remaining root
+    """
+    if v.key > w.key:
+        v.next = w.child
+        w.child = v
+        return w
+    w.next = v.child
+    v.child = w
+    return v
+
+
+class HollowHeap:
+    """Priority queue with amortized O(1) insertion and decrease-key, and
+    O(log n) deletion.
+
+    Priorities are updated with 'heap[item] = new_priority'. The 'smallest'
+    method returns the item with lowest priority and 'pop_smallest' also
+    removes it. The 'sorted_iter' method provides a destructive sorted
+    iterator.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """__init__ Constructor of :class:`HollowHeap` class
+
+        :param args: Same arguments as the constructor of `dict`
+            (items and priorities)
+        """
+        self._root = None
+        self._nodes = {}
+        for item, key in dict(*args, **kwargs).items():
+            self[item] = key
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._nodes
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._nodes)
+
+    def __getitem__(self, item: Any) -> Any:
+        return self._nodes[item].key
+
+    def __setitem__(self, item: Any, key: Any):
+        node = self._nodes.get(item)
+        if node is None:
+            node = self._nodes[item] = _Node(item, key)
+            self._root = node if self._root is None else _link(node, self._root)
+        elif key == node.key:
+            node.key = key  # Same priority: heap is unchanged
+        elif key < node.key:
+            self._decreaseKey(node, key)
+        else:
+            # Increase-key: removal then insertion
+            del self[item]
+            self[item] = key
+
+    def __delitem__(self, item: Any):
+        self._nodes.pop(item).item = _HOLLOW
+        if self._root.item is _HOLLOW:
+            self._rebuild()
+
+    def setdefault(self, item: Any, key: Any) -> Any:
+        if item not in self._nodes:
+            self[item] = key
+            return key
+        return self[item]
+
+    def smallest(self) -> Any:
+        """Return the item with the lowest priority.
+
+        Raises IndexError if the heap is empty.
+        """
+        if self._root is None:
+            raise IndexError("smallest of an empty heap")
+        return self._root.item
+
+    def pop_smallest(self) -> Any:
+        """Return the item with the lowest priority and remove it.
+
+        Raises IndexError if the heap is empty.
+        """
+        item = self.smallest()
+        del self[item]
+        return item
+
+    def sorted_iter(self) -> Iterator[Any]:
+        """Sorted iterator of the heap items.
+
+        Beware: this will destroy elements as they are returned.
+        """
+        while self._nodes:
+            yield self.pop_smallest()
+
+    def _decreaseKey(self, u: _Node, key: Any):
+        """Decrease priority of node u: item moves to a new node, u is hollow"""
+        if u is self._root:
+            u.key = key
+            return
+        v = _Node(u.item, key)
+        self._nodes[u.item] = v
+        u.item = _HOLLOW
+        if u.rank > 2:
+            v.rank = u.rank - 2
+        v.child = u
+        u.ep = v
+        self._root = _link(v, self._root)
+
+    def _rebuild(self):
+        """Remove hollow nodes at the top of the heap and link full ones"""
+        ranked = {}  # rank -> full root
+        h = self._root
+        h.next = None
+        while h is not None:
+            x = h
+            w = x.child
+            h = h.next
+            while w is not None:
+                u = w
+                w = w.next
+                if u.item is _HOLLOW:
+                    if u.ep is None:
+                        u.next = h
+                        h = u
+                    else:
+                        # Hollow node with two parents: x is the second one
+                        # and u its last child
+                        if u.ep is x:
+                            w = None
+                        else:
+                            u.next = None
+                        u.ep = None
+                else:
+                    # Ranked links
+                    while u.rank in ranked:
+                        u = _link(u, ranked.pop(u.rank))
+                        u.rank += 1
+                    ranked[u.rank] = u
+
+        # Unranked links
+        root = None
+        for u in ranked.values():
+            root = u if root is None else _link(root, u)
+        self._root = root
@@ -21,6 +21,8 @@ class Kernel:
 
     __filter_boundary = True
     __kernel_function = None
+    __vectorized_function = None
+    __squared_function = None
     __support = None
 
     def __init__(self, function: Callable[[float], float], support: float):
@@ -46,12 +48,24 @@ class Kernel:
         """
         return self.__filter_boundary
 
-    def setFunction(self, function: Callable[[float], float]):
+    def setFunction(
+        self,
+        function: Callable[[float], float],
+        vectorized_function: Callable[[np.ndarray], np.ndarray] = None,
+        squared_function: Callable[[np.ndarray], np.ndarray] = None,
+    ):
         """Set the function used by Kernel
 
         :param function: A kernel function
+        :param vectorized_function: The same function written with NumPy
+            operations, to evaluate arrays at once (optional)
+        :param squared_function: The same function expressed with NumPy
+            operations on squared distances x^2 (optional, for kernels
+            depending only on x^2, to avoid computing square roots)
         """
         self.__kernel_function = function
+        self.__vectorized_function = vectorized_function
+        self.__squared_function = squared_function
 
     def getFunction(self) -> Callable[[float], float]:
         """Return the function used by the kernel
@@ -60,6 +74,24 @@ class Kernel:
         """
         return self.__kernel_function
 
+    def getVectorizedFunction(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Return the function used by the kernel, applicable on numpy arrays
+
+        :return: A kernel function (element-wise on arrays)
+        """
+        if self.__vectorized_function is None:
+            return np.vectorize(self.__kernel_function)
+        return self.__vectorized_function
+
+    def getSquaredFunction(self) -> Callable[[np.ndarray], np.ndarray]:
+        """Return the function used by the kernel, as a function of squared
+        distances
+
+        :return: A kernel function of x^2 (element-wise on arrays), or None
+            if the kernel has not been defined with such a function
+        """
+        return self.__squared_function
+
     def plot(self, append: bool = False):
         """Plot the kernel
 
@@ -78,9 +110,8 @@ class Kernel:
         :param x: Value to evaluate
         :retun: Kernel value
         """
-        f_support = lambda x: self.__kernel_function(x) * (abs(x) <= self.support)
-        vfunc = np.vectorize(f_support)
-        output = vfunc(x)
+        x = np.asarray(x, dtype=np.float64)
+        output = self.getVectorizedFunction()(x) * (np.abs(x) <= self.support)
         if output.shape == ():
             return float(output)
         return output
@@ -114,7 +145,7 @@ class DiracKernel(Kernel):
         """Constructor of a dirac kernel"""
 
         f = lambda x: 1 * (abs(x) == 0)
-        self.setFunction(f)
+        self.setFunction(f, f)
         self.support = 500  # Arbitrary value for plot
 
     def __str__(self) -> str:
@@ -139,7 +170,7 @@ class UniformKernel(Kernel):
         :param size: The size (:math:`s`) of the kernel
         """
         f = lambda x: 1 * (abs(x) <= size) / (2 * size)
-        self.setFunction(f)
+        self.setFunction(f, f)
         self.support = 2 * size
 
     def __str__(self) -> str:
@@ -164,7 +195,7 @@ class TriangularKernel(Kernel):
         :param size: The size (:math:`s`) of the kernel
         """
         f = lambda x: (size - abs(x)) * (abs(x) <= size) / (size ** 2)
-        self.setFunction(f)
+        self.setFunction(f, f)
         self.support = 1.5 * size
 
     def __str__(self) -> str:
@@ -190,7 +221,13 @@ class GaussianKernel(Kernel):
         f = lambda x: math.exp(-0.5 * (x / sigma) ** 2) / (
             sigma * math.sqrt(2 * math.pi)
         )
-        self.setFunction(f)
+        vf = lambda x: np.exp(-0.5 * (x / sigma) ** 2) / (
+            sigma * math.sqrt(2 * math.pi)
+        )
+        c = -0.5 / sigma ** 2
+        n = 1.0 / (sigma * math.sqrt(2 * math.pi))
+        sf = lambda x2: np.exp(c * x2) * n
+        self.setFunction(f, vf, sf)
         self.support = 3 * sigma
 
     def __str__(self) -> str:
@@ -214,7 +251,8 @@ class ExponentialKernel(Kernel):
 
         """
         f = lambda x: math.exp(-abs(x) / sigma) / (2 * sigma)
-        self.setFunction(f)
+        vf = lambda x: np.exp(-np.abs(x) / sigma) / (2 * sigma)
+        self.setFunction(f, vf)
         self.support = 3 * sigma
 
     def __str__(self) -> str:
@@ -241,7 +279,7 @@ class EpanechnikovKernel(Kernel):
 
         """
         f = lambda x: 3 / 4 * (1 - (x / size) ** 2) * (abs(x) <= size) / size
-        self.setFunction(f)
+        self.setFunction(f, f)
         self.support = 1.5 * size
 
     def __str__(self) -> str:
@@ -275,7 +313,13 @@ class SincKernel(Kernel):
             / (x + 1e-300)
             / (math.pi * scale)
         )
-        self.setFunction(f)
+        vf = (
+            lambda x: scale
+            * np.sin((x + 1e-300) / scale)
+            / (x + 1e-300)
+            / (math.pi * scale)
+        )
+        self.setFunction(f, vf)
         self.support = 3 * size
 
     def __str__(self) -> str:
@@ -13,7 +13,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from tracklib.core.Obs import Obs
-from tracklib.core.Coords import ENUCoords
+from tracklib.core.Coords import ENUCoords, rotateAll
 from tracklib.core.GPSTime import GPSTime
 from tracklib.core.TrackCollection import TrackCollection
 
@@ -306,7 +306,7 @@ class Track:
         if self.getSRID() != "ENU":
             print("Error: shift may be applied only to ENU coords")
             exit()
-        delta = self.getObs(idx_point).position - new_coords
+        delta = new_coords - self.getObs(idx_point).position
         for i in range(self.size()):
             self.getObs(i).position = delta + self.getObs(i).position
 
@@ -1734,8 +1734,7 @@ class Track:
         if not (self.getSRID() == "ENU"):
             print("Error: track to rotate must be in ENU coordinates")
             exit()
-        for i in range(self.size()):
-            self.getObs(i).position.rotate(theta)
+        rotateAll([self.getObs(i).position for i in range(self.size())], theta)
 
     # ------------------------------------------------------------
     # Rotation of 3D track (coordinates should be ENU/ECEF)
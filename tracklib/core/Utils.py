@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Any, Iterable, Optional, Union
 
 import numpy as np
+from scipy.spatial.distance import cdist
 
 from tracklib.core.Coords import GeoCoords
 from tracklib.core.Coords import ENUCoords
@@ -16,6 +17,7 @@ from tracklib.core.Coords import ECEFCoords
 import matplotlib.colors as mcolors
 
 from heapq import heapify, heappush, heappop
+from functools import lru_cache
 
 
 # =============================================================================
@@ -26,57 +28,62 @@ NAN = float("nan")
 
 
 def isnan(number: Union[int, float]) -> bool:
-    """Check if two numbers are different"""
+    """Check if a number is NaN (the only value different from itself)"""
     return number != number
 
 
 def isfloat(value: Any) -> bool:
-    """Check is a value is a float"""
+    """Check is a value can be converted to a float"""
     try:
         float(value)
         return True
-    except ValueError:
+    except (ValueError, TypeError):
         return False
 
 
 def listify(input) -> list[Any]:
-    """Make to list if needed"""
-    if not isinstance(input, list):
-        input = [input]
-    return input
+    """Make to list if needed (a tuple is converted to a list of its items)"""
+    if isinstance(input, list):
+        return input
+    if isinstance(input, tuple):
+        return list(input)
+    return [input]
 
 
 def unlistify(input):
     """Remove list if needed
 
-    :param input: TODO
-    :return: TODO
+    :param input: A list (or tuple), or any other object
+    :return: The single item of input if it is a list (or tuple) of length 1,
+        input otherwise
     """
-    if len(input) == 1:
-        input = input[0]
+    if isinstance(input, (list, tuple)) and len(input) == 1:
+        return input[0]
     return input
 
 
 # LIKE comparisons
 def compLike(s1, s2) -> bool:
-    """TODO
+    """Check if a string matches a LIKE pattern
+
+    The pattern is split on its wildcards '%' and matches if every token is
+    found in s1, in order. Without any wildcard, s1 must be equal to s2.
 
-    :param s1: TODO
-    :param s2: TODO
-    :return: TODO
+    :param s1: A string
+    :param s2: A LIKE pattern (e.g. '2018-01-%')
+    :return: True if s1 matches pattern s2
     """
     tokens = s2.split("%")
     if len(tokens) == 1:
-        return s1 in s2  # 'in' or 'equal' yet to be decided
-    occ = []
-    s = s1
-    d = len(s)
+        return s1 == s2
+    pos = 0
     for tok in tokens:
-        id = s.find(tok)
-        if id < 0:
+        if not tok:
+            continue
+        pos = s1.find(tok, pos)
+        if pos < 0:
             return False
-        occ.append(id)
-        s = s[id + len(tok) : len(s)]
+        pos += len(tok)
     return True
 
 
@@ -92,36 +99,103 @@ def makeCoords(
 
     :return: Coords object in the proper srid
     """
-    if srid.upper() in ["ENUCOORDS", "ENU"]:
-        return ENUCoords(x, y, z)
-    if srid.upper() in ["GEOCOORDS", "GEO"]:
-        return GeoCoords(x, y, z)
-    if srid.upper() in ["ECEFCOORDS", "ECEF"]:
-        return ECEFCoords(x, y, z)
+    coords_class = _COORDS_CLASSES.get(srid.upper())
+    if coords_class is None:
+        raise ValueError("Unknown srid: " + repr(srid))
+    return coords_class(x, y, z)
+
+
+# Coords classes of srid names (upper case)
+_COORDS_CLASSES = {
+    "ENU": ENUCoords,
+    "ENUCOORDS": ENUCoords,
+    "GEO": GeoCoords,
+    "GEOCOORDS": GeoCoords,
+    "ECEF": ECEFCoords,
+    "ECEFCOORDS": ECEFCoords,
+}
 
 
 def makeDistanceMatrix(
-    T1: list[tuple[float, float]], T2: list[tuple[float, float]]
-) -> np.float32:
+    T1: list[tuple[float, float]],
+    T2: list[tuple[float, float]],
+    dtype: np.dtype = np.float64,
+    squared: bool = False,
+) -> np.ndarray:
     """Function to form distance matrix
 
-    :param T1: A list of points
-    :param T2: A list of points
+    :param T1: A list of points (or of scalar values, e.g. timestamps)
+    :param T2: A list of points (or of scalar values, e.g. timestamps)
+    :param dtype: Type of output (e.g. np.float32 to halve memory of large
+        matrices). Distances are always computed in double precision.
+    :param squared: If True, return squared distances (no square root)
     :return: numpy distance matrix between T1 and T2
     """
-    T1 = np.array(T1)
-    T2 = np.array(T2)
-
-    # Signal stationnarity
-    base = min(np.concatenate((T1, T2)))
-    T1 = T1 - base
-    T2 = T2 - base
-    T1 = T1.T
-    T2 = T2.T
-
-    return np.sqrt(
-        (T1 ** 2).reshape(-1, 1) + (T2 ** 2) - 2 * (T1.reshape(-1, 1) * T2.T)
-    )
+    same = T2 is T1
+    T1 = _asPointArray(T1)
+    # Self distances (e.g. makeDistanceMatrix(T, T)): input converted only once
+    T2 = T1 if same else _asPointArray(T2)
+    if T1.shape[1] == 1:
+        # 1D values: a single outer difference (faster than cdist). Floating
+        # output is written directly, other types are cast at the end.
+        direct = np.can_cast(np.float64, dtype, "same_kind")
+        D = np.empty((T1.shape[0], T2.shape[0]), dtype=dtype if direct else None)
+        np.subtract.outer(T1[:, 0], T2[:, 0], out=D)
+        if squared:
+            np.multiply(D, D, out=D)
+        else:
+            np.abs(D, out=D)
+        return D if direct else D.astype(dtype)
+    metric = "sqeuclidean" if squared else "euclidean"
+    return cdist(T1, T2, metric).astype(dtype, copy=False)
+
+
+def makeDistanceMatrixTiled(
+    T1: list[tuple[float, float]],
+    T2: list[tuple[float, float]],
+    block: int = 2048,
+    out: np.ndarray = None,
+    dtype: np.dtype = np.float64,
+    squared: bool = False,
+) -> np.ndarray:
+    """Function to form distance matrix block by block, for large inputs
+
+    Same result as :func:`makeDistanceMatrix`, computed on tiles of
+    block x block elements written in the output matrix, which may be a
+    memory-mapped array (``np.memmap``) for matrices larger than memory.
+
+    :param T1: A list of points (or of scalar values, e.g. timestamps)
+    :param T2: A list of points (or of scalar values, e.g. timestamps)
+    :param block: Size of tiles
+    :param out: Output (N, M) matrix (created with type dtype if None)
+    :param dtype: Type of output when out is None
+    :param squared: If True, return squared distances (no square root)
+    :return: numpy distance matrix between T1 and T2
+    """
+    T1 = _asPointArray(T1)
+    T2 = _asPointArray(T2)
+    N, M = T1.shape[0], T2.shape[0]
+    if out is None:
+        out = np.empty((N, M), dtype=dtype)
+    elif out.shape != (N, M):
+        raise ValueError(
+            "Output matrix of shape " + str(out.shape) + " for " + str((N, M))
+        )
+    for i in range(0, N, block):
+        for j in range(0, M, block):
+            out[i : i + block, j : j + block] = makeDistanceMatrix(
+                T1[i : i + block], T2[j : j + block], out.dtype, squared
+            )
+    return out
+
+
+def _asPointArray(T) -> np.ndarray:
+    """Convert a list of points (or of scalars) to a (N, K) array of float64.
+    No copy is made if T already is a float64 array."""
+    T = np.asarray(T, dtype=np.float64)
+    if T.ndim == 1:
+        T = T.reshape(-1, 1)
+    return T
 
 
 def makeCovarianceMatrixFromKernel(
@@ -138,116 +212,144 @@ def makeCovarianceMatrixFromKernel(
     :param factor: Unit factor of std dev (default 1.0)
     """
 
-    D = makeDistanceMatrix(T1, T2)
-    kfunc = np.vectorize(kernel.getFunction())
+    kfunc = kernel.getSquaredFunction()
+    if kfunc is not None:
+        D = makeDistanceMatrix(T1, T2, squared=True)
+    else:
+        D = makeDistanceMatrix(T1, T2)
+        kfunc = kernel.getVectorizedFunction()
 
-    return factor ** 2 * kfunc(D)
+    # Kernel values scaled in place (no additional N x M temporary)
+    K = np.asarray(kfunc(D), dtype=np.float64)
+    K *= factor ** 2
+    return K
 
 
 def rgbToHex(color: list[float, float, float, Optional[float]]) -> str:
     """Function to convert RGBA color to hexadecimal
 
     :param color: A 3 or 4-element array R, G, B [,alpha]. Each color and transparency
-        channel is in [0,1]
+        channel is in [0,1] (values out of this range are clipped)
     :return: A string containing color in hexadecimal
     """
-    if len(color) == 3:
-        color.append(1)
-    R = hex((int)(color[0] * 255))[2:]
-    G = hex((int)(color[1] * 255))[2:]
-    B = hex((int)(color[2] * 255))[2:]
-    A = hex((int)(color[3] * 255))[2:]
-    if len(R) < 2:
-        R = "0" + R
-    if len(G) < 2:
-        G = "0" + G
-    if len(B) < 2:
-        B = "0" + B
-    if len(A) < 2:
-        A = "0" + A
-    return "0x" + A + B + G + R
+    alpha = color[3] if len(color) == 4 else 1
+    return "0x{:02x}{:02x}{:02x}{:02x}".format(
+        _toByte(alpha), _toByte(color[2]), _toByte(color[1]), _toByte(color[0])
+    )
+
+
+def _toByte(c: float) -> int:
+    """Convert a channel value in [0,1] (clipped) to an integer in [0,255]"""
+    return int(min(max(c, 0.0), 1.0) * 255)
+
+
+# Hexadecimal strings of bytes
+_HEX256 = np.array(["{:02x}".format(i) for i in range(256)])
+
+
+def rgbToHexArray(colors) -> np.ndarray:
+    """Function to convert many RGBA colors to hexadecimal (see :func:`rgbToHex`)
+
+    :param colors: A (K, 3) or (K, 4) array of R, G, B [,alpha]. Each color and
+        transparency channel is in [0,1] (values out of this range are clipped)
+    :return: A numpy array of K strings containing colors in hexadecimal
+    """
+    C = np.asarray(colors, dtype=np.float64)
+    B = (np.clip(C, 0.0, 1.0) * 255).astype(np.uint8)
+    if C.shape[-1] == 3:
+        A = np.full(C.shape[:-1], "ff")
+    else:
+        A = _HEX256[B[..., 3]]
+    H = np.char.add(np.char.add("0x", A), _HEX256[B[..., 2]])
+    return np.char.add(np.char.add(H, _HEX256[B[..., 1]]), _HEX256[B[..., 0]])
 
 
 def interpColors(
-    v: float,
+    v: Union[float, np.ndarray],
     vmin: float,
     vmax: float,
     cmin: list[float, float, float, Optional[float]],
     cmax: list[float, float, float, Optional[float]],
-) -> list[float, float, float, float]:
+) -> Union[list[float, float, float, float], np.ndarray]:
     """
     Function to interpolate RGBA (or RGB) color between two values
 
-    :param v: a float value
+    :param v: a float value (or a numpy array of values)
     :param vmin: minimal value of v (color cmin)
     :param vmax: maximal value of v (color cmin)
     :param cmin: a 3 or 4-element array R, G, B [,alpha]
     :param cmax: a 3 or 4-element array R, G, B [,alpha]
 
-    :return: A 4-element array
+    :return: A 3 or 4-element array as cmin (or, if v is an array, a numpy
+        array of shape v.shape + (3,) or v.shape + (4,))
     """
-    # norm = matplotlib.colors.Normalize(vmin=vmin, vmax=vmax)
-    O = []
-    O.append(((vmax - v) * cmin[0] + (v - vmin) * cmax[0]) / (vmax - vmin))
-    O.append(((vmax - v) * cmin[1] + (v - vmin) * cmax[1]) / (vmax - vmin))
-    O.append(((vmax - v) * cmin[2] + (v - vmin) * cmax[2]) / (vmax - vmin))
+    if isinstance(v, np.ndarray):
+        t = ((v - vmin) / (vmax - vmin))[..., np.newaxis]
+        n = 4 if len(cmin) == 4 else 3
+        cmin = np.asarray(cmin[:n], dtype=np.float64)
+        cmax = np.asarray(cmax[:n], dtype=np.float64)
+        return (1 - t) * cmin + t * cmax
+    t = (v - vmin) / (vmax - vmin)
+    u = 1 - t
+    O = [
+        u * cmin[0] + t * cmax[0],
+        u * cmin[1] + t * cmax[1],
+        u * cmin[2] + t * cmax[2],
+    ]
     if len(cmin) == 4:
-        O.append(((vmax - v) * cmin[3] + (v - vmin) * cmax[3]) / (vmax - vmin))
+        O.append(u * cmin[3] + t * cmax[3])
     return O
 
 
 def getColorMap(cmin, cmax):
-    """TODO
-
-    :param cmin: TODO
-    :param cmax: TODO
-    :return: TODO
-    """
-
-    # On définit la map color
-    cdict = {"red": [], "green": [], "blue": []}
-    cdict["red"].append([0.0, None, cmin[0] / 255])
-    cdict["red"].append([1.0, cmax[0] / 255, None])
-    cdict["green"].append([0.0, None, cmin[1] / 255])
-    cdict["green"].append([1.0, cmax[1] / 255, None])
-    cdict["blue"].append([0.0, None, cmin[2] / 255])
-    cdict["blue"].append([1.0, cmax[2] / 255, None])
+    """Linear colormap between two colors
 
-    cmap = mcolors.LinearSegmentedColormap("CustomMap", cdict)
+    Colormaps are cached: calls with same colors return the same object.
 
-    return cmap
+    :param cmin: R, G, B color of minimal value (channels in [0, 255])
+    :param cmax: R, G, B color of maximal value (channels in [0, 255])
+    :return: A matplotlib colormap
+    """
+    return _makeColorMap(tuple(cmin[0:3]), tuple(cmax[0:3]), None)
 
 
 def getOffsetColorMap(cmin, cmax, part):
-    """TODO
+    """Colormap constant to cmin up to part, then linear up to cmax
 
-    :param cmin: TODO
-    :param cmax: TODO
-    :param part: TODO
-    :return: TODO
-    """
+    Colormaps are cached: calls with same arguments return the same object.
 
-    # On définit la map color
-    cdict = {"red": [], "green": [], "blue": []}
-    cdict["red"].append([0.0, None, cmin[0] / 255])
-    cdict["red"].append([part, cmin[0] / 255, cmin[0] / 255])
-    cdict["red"].append([1.0, cmax[0] / 255, None])
+    :param cmin: R, G, B color of minimal value (channels in [0, 255])
+    :param cmax: R, G, B color of maximal value (channels in [0, 255])
+    :param part: Position of the offset in [0, 1]
+    :return: A matplotlib colormap
+    """
+    return _makeColorMap(tuple(cmin[0:3]), tuple(cmax[0:3]), part)
 
-    cdict["green"].append([0.0, None, cmin[1] / 255])
-    cdict["green"].append([part, cmin[1] / 255, cmin[1] / 255])
-    cdict["green"].append([1.0, cmax[1] / 255, None])
 
-    cdict["blue"].append([0.0, None, cmin[2] / 255])
-    cdict["blue"].append([part, cmin[2] / 255, cmin[2] / 255])
-    cdict["blue"].append([1.0, cmax[2] / 255, None])
+@lru_cache(maxsize=128)
+def _makeColorMap(cmin: tuple, cmax: tuple, part: Optional[float]):
+    """Build (once) the colormap of getColorMap (part is None) and
+    getOffsetColorMap"""
 
-    cmap = mcolors.LinearSegmentedColormap("CustomMap", cdict)
+    # On définit la map color
+    cdict = {}
+    for i, channel in enumerate(["red", "green", "blue"]):
+        c0 = cmin[i] / 255
+        c1 = cmax[i] / 255
+        cdict[channel] = [[0.0, None, c0]]
+        if part is not None:
+            cdict[channel].append([part, c0, c0])
+        cdict[channel].append([1.0, c1, None])
 
-    return cmap
+    return mcolors.LinearSegmentedColormap("CustomMap", cdict)
 
 
 # --------------------------------------------------------------------------
 # Priority heap
+# --------------------------------------------------------------------------
+_MISSING = object()  # Priority of items not in a priority_dict
+
+
 # --------------------------------------------------------------------------
 # Source code from Matteo Dell'Amico
 # https://gist.github.com/matteodellamico/4451520
@@ -274,6 +376,7 @@ class priority_dict(dict):
     def _rebuild_heap(self):
         self._heap = [(v, k) for k, v in self.items()]
         heapify(self._heap)
+        self._stale = 0  # Number of outdated entries in heap
 
     def smallest(self):
         """Return the item with the lowest priority.
@@ -282,9 +385,11 @@ class priority_dict(dict):
         """
 
         heap = self._heap
+        get = self.get
         v, k = heap[0]
-        while k not in self or self[k] != v:
+        while get(k, _MISSING) != v:
             heappop(heap)
+            self._stale -= 1
             v, k = heap[0]
         return k
 
@@ -295,23 +400,36 @@ class priority_dict(dict):
         """
 
         heap = self._heap
+        get = self.get
         v, k = heappop(heap)
-        while k not in self or self[k] != v:
+        while get(k, _MISSING) != v:
+            self._stale -= 1
             v, k = heappop(heap)
-        del self[k]
+        super(priority_dict, self).__delitem__(k)
         return k
 
     def __setitem__(self, key, val):
         # We are not going to remove the previous value from the heap,
-        # since this would have a cost O(n).
+        # since this would have a cost O(n). It is left as a stale entry,
+        # skipped when popped.
+        old = self.get(key, _MISSING)
         super(priority_dict, self).__setitem__(key, val)
-        if len(self._heap) < 2 * len(self):
+        if old is not _MISSING:
+            if old == val:
+                return  # Heap entry of key is still valid
+            self._stale += 1
+        if self._stale <= len(self):
             heappush(self._heap, (val, key))
         else:
-            # When the heap grows larger than 2 * len(self), we rebuild it
+            # When stale entries outnumber live ones, we rebuild the heap
             # from scratch to avoid wasting too much memory.
             self._rebuild_heap()
 
+    def __delitem__(self, key):
+        # Heap entry of key is left as a stale entry
+        super(priority_dict, self).__delitem__(key)
+        self._stale += 1
+
     def setdefault(self, key, val):
         if key not in self:
             self[key] = val